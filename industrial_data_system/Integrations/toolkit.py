@@ -1,13 +1,19 @@
-"""Convenience accessors for AI tooling used across applications."""
+"""Convenience accessors for AI tooling used across applications.
+
+Tools built on matplotlib are imported on first use so that applications which
+only link to them do not pay for the plotting stack at startup.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 from industrial_data_system.Integrations.analysis.data_study import run as run_ai_data_study
-from industrial_data_system.Integrations.anomaly_detection.anomaly_detector import run as run_anomaly_detector
-from industrial_data_system.Integrations.anomaly_detection.anomaly_detector import run_standalone as run_anomaly_detector_standalone
-from industrial_data_system.Integrations.anomaly_detection.anomaly_detector import create_anomaly_widget
 from industrial_data_system.Integrations.training.simulator import run as run_training_simulation
-from industrial_data_system.Integrations.visualization.plotter import run as run_plotter
-from industrial_data_system.Integrations.visualization.plotter import create_plotter_widget
-from industrial_data_system.Integrations.Test_APP.TestApp import run_test_app
+
+if TYPE_CHECKING:
+    from PyQt5.QtWidgets import QWidget
 
 __all__ = [
     "run_ai_data_study",
@@ -18,4 +24,46 @@ __all__ = [
     "create_plotter_widget",
     "create_anomaly_widget",
     "run_test_app"
-]
\ No newline at end of file
+]
+
+
+def run_plotter(file_path: Path | str) -> None:
+    """Launch the enhanced plotter window."""
+    from industrial_data_system.Integrations.visualization.plotter import run
+
+    run(file_path)
+
+
+def create_plotter_widget(file_path: Path) -> Optional[QWidget]:
+    """Create an embeddable plotter widget."""
+    from industrial_data_system.Integrations.visualization.plotter import create_plotter_widget
+
+    return create_plotter_widget(file_path)
+
+
+def run_anomaly_detector(file_path: Path | str, parent: Optional[QWidget] = None) -> None:
+    """Launch the anomaly detector window for the provided file path."""
+    from industrial_data_system.Integrations.anomaly_detection.anomaly_detector import run
+
+    run(file_path, parent)
+
+
+def run_anomaly_detector_standalone(parent: Optional[QWidget] = None) -> None:
+    """Launch the anomaly detector window without a file."""
+    from industrial_data_system.Integrations.anomaly_detection.anomaly_detector import run_standalone
+
+    run_standalone(parent)
+
+
+def create_anomaly_widget(file_path: Optional[Path] = None) -> Optional[QWidget]:
+    """Create an embeddable anomaly detector widget."""
+    from industrial_data_system.Integrations.anomaly_detection.anomaly_detector import create_anomaly_widget
+
+    return create_anomaly_widget(file_path)
+
+
+def run_test_app():
+    """Launch the test application."""
+    from industrial_data_system.Integrations.Test_APP.TestApp import run_test_app
+
+    return run_test_app()
@@ -1,5 +1,12 @@
 """Visualization helpers for AI outputs and diagnostics."""
 
-from .plotter import run as run_plotter
-
 __all__ = ["run_plotter"]
+
+
+def __getattr__(name):
+    # The plotter pulls in matplotlib; load it only when first requested
+    if name == "run_plotter":
+        from .plotter import run as run_plotter
+
+        return run_plotter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
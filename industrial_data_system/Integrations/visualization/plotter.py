@@ -6,20 +6,28 @@ import datetime
 import io
 import json
 import os
+import pickle
 import tempfile
+import threading
+import warnings
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+import matplotlib
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.axes import Axes
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 from matplotlib.patches import Rectangle
 from matplotlib.lines import Line2D
-from PyQt5.QtCore import Qt, QRectF, pyqtSignal, QSize
-from PyQt5.QtGui import QFont, QColor, QPalette, QIcon, QTextCursor
+from matplotlib.ticker import AutoLocator, ScalarFormatter
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QRectF, QTimer, pyqtSignal, QSize
+from PyQt5.QtGui import QFont, QColor, QPalette, QIcon, QStandardItem, QStandardItemModel, QTextCursor
 from PyQt5.QtWidgets import (
     QAbstractItemView,
     QAction,
@@ -49,8 +57,7 @@ from PyQt5.QtWidgets import (
     QSlider,
     QSpinBox,
     QSplitter,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTextEdit,
     QToolBar,
     QToolButton,
@@ -58,6 +65,7 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
+from industrial_data_system.core.workers import DataFrameLoadWorker, ReportExportWorker
 from industrial_data_system.utils.asc_utils import (
     load_and_process_asc_file,
     load_and_process_csv_file,
@@ -66,6 +74,102 @@ from industrial_data_system.utils.asc_utils import (
 
 __all__ = ["run", "create_plotter_widget"]
 
+# Simplify long paths and let Agg stroke them in chunks; dense sensor traces
+# are far beyond screen resolution anyway. Figures use constrained layout, so
+# keep a user's matplotlibrc from adding tight_layout on every draw.
+matplotlib.rcParams.update({
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+    "figure.autolayout": False,
+})
+
+# Lines with more points than this are drawn without antialiasing.
+_ANTIALIAS_MAX_POINTS = 5000
+
+# Series are downsampled to at least this many points before drawing.
+_MIN_DOWNSAMPLE_POINTS = 2000
+
+# Colors cycled through for plotted series.
+_SERIES_COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd')
+
+# Recently parsed files keyed by (resolved path, mtime, size). Loaded frames are
+# never modified in place, so windows on the same file can share one.
+_FILE_CACHE_SIZE = 4
+_FILE_CACHE: "OrderedDict[Tuple[str, int, int], pd.DataFrame]" = OrderedDict()
+_FILE_CACHE_LOCK = threading.Lock()
+
+
+def _downsample_lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Pick n_out point indices with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, for each bucket in between, the point
+    forming the largest triangle with the previously kept point and the mean of
+    the next bucket, which preserves peaks and the visual shape of the line.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Interior points split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[:n - 1], edges[:-1]) / counts
+    mean_y = np.add.reduceat(y[:n - 1], edges[:-1]) / counts
+    # Mean of the *next* bucket; the last bucket looks ahead to the final point
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        ax, ay = x[a], y[a]
+        area = np.abs(
+            (ax - next_x[i]) * (y[start:end] - ay) - (ax - x[start:end]) * (next_y[i] - ay)
+        )
+        a = start + int(area.argmax())
+        indices[i + 1] = a
+    return indices
+
+
+def _fast_write_csv(df: pd.DataFrame, path: str) -> None:
+    """Write a dataframe to CSV with pyarrow's writer, falling back to pandas."""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        df.to_csv(path, index=False)
+        return
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
+
+def _parquet_plot_columns(path: Path) -> Optional[List[str]]:
+    """Get the Parquet columns worth loading, or None when all of them are.
+
+    Only the footer schema is read. Nested and binary columns can be neither
+    plotted nor summarised, so they are left on disk.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pq.read_schema(path)
+    columns = [
+        field.name for field in schema
+        if not (pa.types.is_nested(field.type)
+                or pa.types.is_binary(field.type)
+                or pa.types.is_large_binary(field.type))
+    ]
+    pandas_metadata = schema.pandas_metadata or {}
+    index_columns = {
+        column for column in pandas_metadata.get("index_columns", []) if isinstance(column, str)
+    }
+    if len(columns) == len(schema.names):
+        return None
+    return [column for column in columns if column not in index_columns]
+
 
 # ============================================================================
 # REPORT SECTION CLASSES
@@ -249,8 +353,8 @@ class ReportPlot(ReportSection):
         """Build plot area."""
         layout = self.get_content_layout()
 
-        # Plot figure
-        self.figure = Figure(figsize=(8, 5), dpi=100)
+        # Plot figure (constrained layout keeps geometry stable across replots)
+        self.figure = Figure(figsize=(8, 5), dpi=100, layout="constrained")
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setMinimumHeight(400)
         layout.addWidget(self.canvas)
@@ -283,6 +387,66 @@ class ReportPlot(ReportSection):
         return self.figure
 
 
+class StatisticsTableModel(QAbstractTableModel):
+    """Table model serving statistics cells without per-cell Qt items."""
+
+    HEADERS = ["Column", "Max", "Mean", "Min", "Std"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[str] = []
+        self._data = np.empty((0, 4))
+        self._text = np.empty((0, 4), dtype=str)
+
+    def set_stats(self, rows: List[str], data: np.ndarray):
+        """Replace the model contents with (max, mean, min, std) rows.
+
+        When the rows are unchanged only the values are refreshed, so attached
+        views keep their layout instead of rebuilding after a model reset.
+        """
+        # Format every value in one vectorised pass
+        text = np.char.mod('%.4g', data)
+        if rows == self._rows and data.shape == self._data.shape:
+            self._data = data
+            self._text = text
+            if rows:
+                self.dataChanged.emit(
+                    self.index(0, 1), self.index(len(rows) - 1, len(self.HEADERS) - 1)
+                )
+            return
+
+        self.beginResetModel()
+        self._rows = rows
+        self._data = data
+        self._text = text
+        self.endResetModel()
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Get the unformatted statistics as a dataframe."""
+        df = pd.DataFrame(self._data, columns=self.HEADERS[1:])
+        df.insert(0, self.HEADERS[0], self._rows)
+        return df
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if col == 0:
+            return self._rows[row]
+        return str(self._text[row, col - 1])
+
+
 class ReportStatistics(ReportSection):
     """Statistics table section."""
 
@@ -294,15 +458,15 @@ class ReportStatistics(ReportSection):
         """Build statistics table."""
         layout = self.get_content_layout()
 
-        self.stats_table = QTableWidget()
-        self.stats_table.setColumnCount(5)
-        self.stats_table.setHorizontalHeaderLabels(["Column", "Max", "Mean", "Min", "Std"])
+        self.stats_model = StatisticsTableModel(self)
+        self.stats_table = QTableView()
+        self.stats_table.setModel(self.stats_model)
         self.stats_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.stats_table.verticalHeader().setVisible(False)
-        self.stats_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.stats_table.setSelectionMode(QTableWidget.NoSelection)
+        self.stats_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.stats_table.setSelectionMode(QAbstractItemView.NoSelection)
         self.stats_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background: white;
                 border: 1px solid #E5E7EB;
                 border-radius: 4px;
@@ -310,17 +474,31 @@ class ReportStatistics(ReportSection):
         """)
         layout.addWidget(self.stats_table)
 
-    def update_stats(self, df: pd.DataFrame):
-        """Update statistics table with data."""
-        if df is not None and not df.empty:
-            stats = df.describe().transpose()
-            self.stats_table.setRowCount(len(stats))
-            for i, (index, row) in enumerate(stats.iterrows()):
-                self.stats_table.setItem(i, 0, QTableWidgetItem(str(index)))
-                self.stats_table.setItem(i, 1, QTableWidgetItem(f"{row['max']:.4g}"))
-                self.stats_table.setItem(i, 2, QTableWidgetItem(f"{row['mean']:.4g}"))
-                self.stats_table.setItem(i, 3, QTableWidgetItem(f"{row['min']:.4g}"))
-                self.stats_table.setItem(i, 4, QTableWidgetItem(f"{row['std']:.4g}"))
+        export_btn = QPushButton("Export CSV...")
+        export_btn.clicked.connect(self._export_csv)
+        layout.addWidget(export_btn, alignment=Qt.AlignRight)
+
+    def _export_csv(self):
+        """Save the statistics table as a CSV file."""
+        filepath, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Statistics as CSV",
+            "statistics.csv",
+            "CSV Files (*.csv)"
+        )
+        if not filepath:
+            return
+
+        try:
+            _fast_write_csv(self.stats_model.to_dataframe(), filepath)
+        except Exception as e:
+            QMessageBox.critical(self, "Export Failed", f"Failed to export statistics:\n{e}")
+
+    def update_stats(self, columns: List[str], stats: Dict[str, Tuple[float, float, float, float]]):
+        """Update statistics table from precomputed (max, mean, min, std) values."""
+        columns = [column for column in columns if column in stats]
+        data = np.array([stats[column] for column in columns], dtype=float).reshape(-1, 4)
+        self.stats_model.set_stats(columns, data)
 
 
 class ReportDataOverview(ReportSection):
@@ -334,13 +512,6 @@ class ReportDataOverview(ReportSection):
         """Build overview table."""
         layout = self.get_content_layout()
 
-        overview_table = QTableWidget()
-        overview_table.setColumnCount(2)
-        overview_table.setHorizontalHeaderLabels(["Property", "Value"])
-        overview_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        overview_table.verticalHeader().setVisible(False)
-        overview_table.setEditTriggers(QTableWidget.NoEditTriggers)
-
         # Calculate properties
         props = [
             ("File Name", file_path.name),
@@ -349,16 +520,25 @@ class ReportDataOverview(ReportSection):
             ("Memory Usage", f"{df.memory_usage(deep=True).sum() / 1024**2:.2f} MB"),
         ]
 
-        overview_table.setRowCount(len(props))
-        for i, (prop, value) in enumerate(props):
-            prop_item = QTableWidgetItem(prop)
-            prop_item.setFont(QFont("", -1, QFont.Bold))
-            prop_item.setForeground(QColor("#6B7280"))
-            overview_table.setItem(i, 0, prop_item)
-            overview_table.setItem(i, 1, QTableWidgetItem(str(value)))
-
+        # Fill the model before attaching it so the view lays out once
+        model = QStandardItemModel(0, 2, self)
+        model.setHorizontalHeaderLabels(["Property", "Value"])
+        prop_font = QFont("", -1, QFont.Bold)
+        prop_color = QColor("#6B7280")
+        for prop, value in props:
+            prop_item = QStandardItem(prop)
+            prop_item.setFont(prop_font)
+            prop_item.setForeground(prop_color)
+            model.appendRow([prop_item, QStandardItem(str(value))])
+
+        overview_table = QTableView()
+        overview_table.setModel(model)
+        overview_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        overview_table.setColumnWidth(0, 120)
+        overview_table.verticalHeader().setVisible(False)
+        overview_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         overview_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background: white;
                 border: 1px solid #E5E7EB;
                 border-radius: 4px;
@@ -458,155 +638,176 @@ class ScrollableReport(QScrollArea):
 
     def export_to_pdf(self, filepath: str):
         """Export report as PDF."""
-        temp_files = []  # Track temp files to clean up later
+        return _build_report_pdf(filepath, self.snapshot())
+
+    def snapshot(self) -> List[Tuple]:
+        """Capture section contents so the PDF can be built off the GUI thread.
+
+        Figures are pickled, giving the exporter private copies to rasterise
+        while the on-screen figures keep responding to the user.
+        """
+        contents = []
+        for section in self.sections:
+            if isinstance(section, ReportHeader):
+                contents.append(("header", section.get_data()))
+            elif isinstance(section, ReportText):
+                contents.append(("text", section.title, section.get_text()))
+            elif isinstance(section, ReportPlot):
+                contents.append((
+                    "plot",
+                    section.title,
+                    pickle.dumps(section.get_figure()),
+                    section.get_caption(),
+                ))
+            elif isinstance(section, ReportStatistics):
+                model = section.stats_model
+                data = [list(model.HEADERS)]
+                for row in range(model.rowCount()):
+                    data.append([
+                        model.index(row, col).data() for col in range(model.columnCount())
+                    ])
+                contents.append(("stats", section.title, data))
+        return contents
 
-        try:
-            from reportlab.lib.pagesizes import A4, landscape
-            from reportlab.lib.units import inch
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib import colors
-
-            # Create document
-            doc = SimpleDocTemplate(
-                filepath,
-                pagesize=landscape(A4),
-                rightMargin=0.5*inch,
-                leftMargin=0.5*inch,
-                topMargin=0.5*inch,
-                bottomMargin=0.5*inch
-            )
 
-            story = []
-            styles = getSampleStyleSheet()
+# Continue in next part...
 
-            # Custom styles
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                textColor=colors.HexColor('#1F2937'),
-                spaceAfter=12
-            )
 
-            heading_style = ParagraphStyle(
-                'CustomHeading',
-                parent=styles['Heading2'],
-                fontSize=14,
-                textColor=colors.HexColor('#374151'),
-                spaceAfter=6
-            )
+def _build_report_pdf(filepath: str, contents: List[Tuple]) -> bool:
+    """Build a PDF from section contents captured by ScrollableReport.snapshot()."""
+    temp_files = []  # Track temp files to clean up later
 
-            # Process each section
-            for section in self.sections:
-                if isinstance(section, ReportHeader):
-                    data = section.get_data()
-                    story.append(Paragraph(data['title'], title_style))
-                    story.append(Spacer(1, 0.2*inch))
-
-                    meta_text = f"<b>File:</b> {data['file']}<br/>" \
-                                f"<b>Generated:</b> {data['date']}<br/>" \
-                                f"<b>Author:</b> {data['author']}"
-                    story.append(Paragraph(meta_text, styles['Normal']))
-                    story.append(Spacer(1, 0.3*inch))
-
-                elif isinstance(section, ReportText):
-                    story.append(Paragraph(section.title, heading_style))
-                    text = section.get_text().replace('\n', '<br/>')
-                    story.append(Paragraph(text, styles['Normal']))
-                    story.append(Spacer(1, 0.2*inch))
-
-                elif isinstance(section, ReportPlot):
-                    story.append(Paragraph(section.title, heading_style))
-
-                    # Save figure to temporary file
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp:
-                        temp_path = tmp.name
-
-                    # Save the figure
-                    section.get_figure().savefig(temp_path, format='png', dpi=150, bbox_inches='tight')
-
-                    # Track for cleanup
-                    temp_files.append(temp_path)
-
-                    # Add image to PDF (file must exist until doc.build() completes)
-                    img = Image(temp_path, width=9*inch, height=5*inch)
-                    story.append(img)
-
-                    # Add caption
-                    caption = section.get_caption()
-                    if caption:
-                        story.append(Spacer(1, 0.1*inch))
-                        caption_style = ParagraphStyle(
-                            'Caption',
-                            parent=styles['Normal'],
-                            fontSize=9,
-                            textColor=colors.HexColor('#6B7280'),
-                            italic=True
-                        )
-                        story.append(Paragraph(f"<i>{caption}</i>", caption_style))
-
-                    story.append(Spacer(1, 0.2*inch))
-
-                elif isinstance(section, ReportStatistics):
-                    story.append(Paragraph(section.title, heading_style))
-
-                    # Convert QTableWidget to reportlab Table
-                    table = section.stats_table
-                    data = []
-
-                    # Headers
-                    headers = []
-                    for col in range(table.columnCount()):
-                        headers.append(table.horizontalHeaderItem(col).text())
-                    data.append(headers)
-
-                    # Rows
-                    for row in range(table.rowCount()):
-                        row_data = []
-                        for col in range(table.columnCount()):
-                            item = table.item(row, col)
-                            row_data.append(item.text() if item else "")
-                        data.append(row_data)
-
-                    # Create table
-                    t = Table(data)
-                    t.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#F3F4F6')),
-                        ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#1F2937')),
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, 0), 10),
-                        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E5E7EB')),
-                    ]))
-
-                    story.append(t)
-                    story.append(Spacer(1, 0.2*inch))
-
-            # Build PDF (this is when ReportLab actually reads the image files)
-            doc.build(story)
-
-            return True
+    try:
+        from reportlab.lib.pagesizes import A4, landscape
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib import colors
+
+        # Create document
+        doc = SimpleDocTemplate(
+            filepath,
+            pagesize=landscape(A4),
+            rightMargin=0.5*inch,
+            leftMargin=0.5*inch,
+            topMargin=0.5*inch,
+            bottomMargin=0.5*inch
+        )
 
-        except Exception as e:
-            print(f"Error exporting to PDF: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
+        story = []
+        styles = getSampleStyleSheet()
 
-        finally:
-            # Clean up all temporary files AFTER PDF is built
-            for temp_file in temp_files:
-                try:
-                    if os.path.exists(temp_file):
-                        os.unlink(temp_file)
-                except Exception as e:
-                    print(f"Warning: Could not delete temp file {temp_file}: {e}")
+        # Custom styles
+        title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=colors.HexColor('#1F2937'),
+            spaceAfter=12
+        )
 
+        heading_style = ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=14,
+            textColor=colors.HexColor('#374151'),
+            spaceAfter=6
+        )
 
-# Continue in next part...
+        # Process each section
+        for kind, *content in contents:
+            if kind == "header":
+                data = content[0]
+                story.append(Paragraph(data['title'], title_style))
+                story.append(Spacer(1, 0.2*inch))
+
+                meta_text = f"<b>File:</b> {data['file']}<br/>" \
+                            f"<b>Generated:</b> {data['date']}<br/>" \
+                            f"<b>Author:</b> {data['author']}"
+                story.append(Paragraph(meta_text, styles['Normal']))
+                story.append(Spacer(1, 0.3*inch))
+
+            elif kind == "text":
+                title, text = content
+                story.append(Paragraph(title, heading_style))
+                text = text.replace('\n', '<br/>')
+                story.append(Paragraph(text, styles['Normal']))
+                story.append(Spacer(1, 0.2*inch))
+
+            elif kind == "plot":
+                title, figure_bytes, caption = content
+                story.append(Paragraph(title, heading_style))
+
+                # Save figure to temporary file
+                with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp:
+                    temp_path = tmp.name
+
+                # Save the figure
+                figure = pickle.loads(figure_bytes)
+                # Constrained layout already trims the margins, so skip the extra
+                # measuring render that bbox_inches='tight' would cost
+                figure.savefig(temp_path, format='png', dpi=150)
+
+                # Track for cleanup
+                temp_files.append(temp_path)
+
+                # Add image to PDF (file must exist until doc.build() completes)
+                img = Image(temp_path, width=9*inch, height=5*inch)
+                story.append(img)
+
+                # Add caption
+                if caption:
+                    story.append(Spacer(1, 0.1*inch))
+                    caption_style = ParagraphStyle(
+                        'Caption',
+                        parent=styles['Normal'],
+                        fontSize=9,
+                        textColor=colors.HexColor('#6B7280'),
+                        italic=True
+                    )
+                    story.append(Paragraph(f"<i>{caption}</i>", caption_style))
+
+                story.append(Spacer(1, 0.2*inch))
+
+            elif kind == "stats":
+                title, data = content
+                story.append(Paragraph(title, heading_style))
+
+                # Create table
+                t = Table(data)
+                t.setStyle(TableStyle([
+                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#F3F4F6')),
+                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#1F2937')),
+                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                    ('FONTSIZE', (0, 0), (-1, 0), 10),
+                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+                    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E5E7EB')),
+                ]))
+
+                story.append(t)
+                story.append(Spacer(1, 0.2*inch))
+
+        # Build PDF (this is when ReportLab actually reads the image files)
+        doc.build(story)
+
+        return True
+
+    except Exception as e:
+        print(f"Error exporting to PDF: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+    finally:
+        # Clean up all temporary files AFTER PDF is built
+        for temp_file in temp_files:
+            try:
+                if os.path.exists(temp_file):
+                    os.unlink(temp_file)
+            except Exception as e:
+                print(f"Warning: Could not delete temp file {temp_file}: {e}")
 
 
 # ============================================================================
@@ -656,12 +857,17 @@ class BaseTool:
 
 
 class SelectionTool(BaseTool):
-    """Tool for selecting regions of data."""
+    """Tool for selecting regions of data.
+
+    The rectangle is blitted over a snapshot of the rendered canvas, so dragging
+    does not re-render the plotted series on every mouse move.
+    """
 
     def __init__(self, canvas: FigureCanvas, callback=None):
         super().__init__(canvas)
         self.start_point = None
         self.selection_rect = None
+        self.background = None
         self.callback = callback
 
     def connect_events(self):
@@ -681,26 +887,26 @@ class SelectionTool(BaseTool):
         if event.inaxes and event.button == 1:
             self.start_point = (event.xdata, event.ydata)
 
-    def on_motion(self, event):
-        """Update selection rectangle."""
-        if self.start_point and event.inaxes and event.button == 1:
-            x0, y0 = self.start_point
-            x1, y1 = event.xdata, event.ydata
-
-            # Remove old rectangle
-            if self.selection_rect:
-                self.selection_rect.remove()
-
-            # Draw new rectangle
-            width = x1 - x0
-            height = y1 - y0
+            # Snapshot the canvas as rendered; the animated rectangle is drawn on top
+            self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
             self.selection_rect = Rectangle(
-                (x0, y0), width, height,
+                self.start_point, 0, 0,
                 fill=True, alpha=0.2, color='blue',
-                linestyle='--', linewidth=2, edgecolor='blue'
+                linestyle='--', linewidth=2, edgecolor='blue',
+                animated=True
             )
             event.inaxes.add_patch(self.selection_rect)
-            self.canvas.draw_idle()
+
+    def on_motion(self, event):
+        """Update selection rectangle."""
+        if self.start_point and event.inaxes and event.button == 1 and self.selection_rect:
+            x0, y0 = self.start_point
+            self.selection_rect.set_width(event.xdata - x0)
+            self.selection_rect.set_height(event.ydata - y0)
+
+            self.canvas.restore_region(self.background)
+            self.selection_rect.axes.draw_artist(self.selection_rect)
+            self.canvas.blit(self.canvas.figure.bbox)
 
     def on_release(self, event):
         """Complete selection."""
@@ -712,16 +918,19 @@ class SelectionTool(BaseTool):
             x_min, x_max = min(x0, x1), max(x0, x1)
             y_min, y_max = min(y0, y1), max(y0, y1)
 
-            # Call callback with selection
-            if self.callback:
-                self.callback(x_min, x_max, y_min, y_max)
-
-            # Clear
+            # Clear by restoring the snapshot
             if self.selection_rect:
                 self.selection_rect.remove()
                 self.selection_rect = None
+            if self.background is not None:
+                self.canvas.restore_region(self.background)
+                self.canvas.blit(self.canvas.figure.bbox)
+                self.background = None
             self.start_point = None
-            self.canvas.draw_idle()
+
+            # Call callback with selection
+            if self.callback:
+                self.callback(x_min, x_max, y_min, y_max)
 
 
 class AnnotationTool(BaseTool):
@@ -873,14 +1082,63 @@ class CollapsiblePanel(QWidget):
 # DATA FILTER PIPELINE
 # ============================================================================
 
+def _column_to_array(series: pd.Series, dtype) -> np.ndarray:
+    """Convert a column to a contiguous float array with missing values as NaN.
+
+    Numeric columns (including Arrow-backed ones) convert directly and
+    timestamps become Matplotlib date numbers; anything else is parsed with
+    ``pd.to_numeric`` first.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        if series.dt.tz is not None:
+            series = series.dt.tz_convert(None)
+        values = series.to_numpy(dtype='datetime64[ns]', na_value=np.datetime64('NaT', 'ns'))
+        dates = np.where(np.isnat(values), np.nan, mdates.date2num(values))
+        return np.ascontiguousarray(dates, dtype=dtype)
+    if not pd.api.types.is_numeric_dtype(series):
+        series = pd.to_numeric(series, errors='coerce')
+    return np.ascontiguousarray(series.to_numpy(dtype=dtype, na_value=np.nan))
+
+
+def _evaluate_expression(df: pd.DataFrame, expression: str) -> pd.Series:
+    """Evaluate a column expression, preferring numexpr over the Python engine."""
+    try:
+        result = df.eval(expression, engine='numexpr')
+    except Exception:
+        # numexpr missing or unable to handle the expression
+        result = df.eval(expression, engine='python')
+
+    if not isinstance(result, pd.Series):
+        raise ValueError("Expression must produce a column, not a single value.")
+    return result
+
+
 class DataFilterPipeline:
     """Pipeline for applying filters to data."""
 
     def __init__(self, dataframe: pd.DataFrame):
-        self.original_data = dataframe.copy()
-        self.filtered_data = dataframe.copy()
+        self._stats_cache: Dict[str, Tuple[float, float, float, float]] | None = None
+        self._plot_arrays: Dict[str, np.ndarray] = {}
+        self._numeric_arrays: Dict[str, np.ndarray] = {}
+        self._valid_masks: Dict[str, np.ndarray] = {}
+        # Filters always build new frames, so the source is shared rather than copied
+        self.original_data = dataframe
+        self.filtered_data = dataframe
         self.filters = []
 
+    @property
+    def filtered_data(self) -> pd.DataFrame:
+        """Current filtered dataframe."""
+        return self._filtered_data
+
+    @filtered_data.setter
+    def filtered_data(self, dataframe: pd.DataFrame):
+        self._filtered_data = dataframe
+        self._stats_cache = None
+        self._plot_arrays = {}
+        self._numeric_arrays = {}
+        self._valid_masks = {}
+
     def add_time_range_filter(self, start_time, end_time, time_column='Time'):
         """Filter by time range."""
         if time_column in self.filtered_data.columns:
@@ -912,6 +1170,13 @@ class DataFilterPipeline:
         """Remove rows with NaN values."""
         self.filtered_data = self.filtered_data.dropna(subset=columns)
 
+    def add_derived_column(self, name: str, expression: str) -> pd.Series:
+        """Evaluate an expression over the data and store it as a new column."""
+        series = _evaluate_expression(self.original_data, expression)
+        self.original_data = self.original_data.assign(**{name: series})
+        self.filtered_data = self.filtered_data.assign(**{name: series})
+        return series
+
     def apply_moving_average(self, column: str, window: int = 10) -> pd.Series:
         """Apply moving average to column."""
         if column in self.filtered_data.columns:
@@ -920,13 +1185,77 @@ class DataFilterPipeline:
 
     def reset(self):
         """Reset to original data."""
-        self.filtered_data = self.original_data.copy()
+        self.filtered_data = self.original_data
         self.filters = []
 
     def get_filtered_data(self) -> pd.DataFrame:
         """Get the filtered dataframe."""
         return self.filtered_data
 
+    def get_plot_array(self, column: str) -> np.ndarray:
+        """Get a float32 copy of a filtered column for plotting.
+
+        Half the width of the float64 source, which is plenty at screen
+        resolution. Cached until the filtered data changes.
+        """
+        array = self._plot_arrays.get(column)
+        if array is None:
+            array = _column_to_array(self.filtered_data[column], np.float32)
+            self._plot_arrays[column] = array
+        return array
+
+    def get_numeric_array(self, column: str) -> np.ndarray:
+        """Get a filtered column as float64 with non-numeric values as NaN.
+
+        Cached until the filtered data changes.
+        """
+        array = self._numeric_arrays.get(column)
+        if array is None:
+            array = _column_to_array(self.filtered_data[column], np.float64)
+            self._numeric_arrays[column] = array
+        return array
+
+    def get_valid_mask(self, column: str) -> np.ndarray:
+        """Get the non-NaN mask of a column's plot array, cached per filter state."""
+        mask = self._valid_masks.get(column)
+        if mask is None:
+            mask = ~np.isnan(self.get_plot_array(column))
+            self._valid_masks[column] = mask
+        return mask
+
+    def get_column_stats(self) -> Dict[str, Tuple[float, float, float, float]]:
+        """Get (max, mean, min, std) for every numeric column of the filtered data.
+
+        Computed once per filter state and reused until the filtered data changes.
+        Reductions run over the float64 numeric arrays so exported values keep
+        full precision.
+        """
+        if self._stats_cache is None:
+            numeric_columns = self.filtered_data.select_dtypes(include=[np.number]).columns
+            if len(numeric_columns) == 0:
+                self._stats_cache = {}
+                return self._stats_cache
+
+            # One (rows, columns) buffer so each statistic is a single sweep
+            stack = np.stack([self.get_numeric_array(column) for column in numeric_columns], axis=1)
+            if stack.shape[0] == 0:
+                stats = np.full((len(numeric_columns), 4), np.nan)
+            else:
+                with warnings.catch_warnings():
+                    # All-NaN columns yield NaN statistics, same as pandas
+                    warnings.simplefilter("ignore", RuntimeWarning)
+                    stats = np.column_stack([
+                        np.nanmax(stack, axis=0),
+                        np.nanmean(stack, axis=0),
+                        np.nanmin(stack, axis=0),
+                        np.nanstd(stack, axis=0, ddof=1),
+                    ])
+            self._stats_cache = {
+                str(column): tuple(row)
+                for column, row in zip(numeric_columns, stats.tolist(), strict=True)
+            }
+        return self._stats_cache
+
 
 # Continue in next part...
 
@@ -936,38 +1265,109 @@ class DataFilterPipeline:
 # ============================================================================
 
 class EnhancedPlotterWindow(QMainWindow):
-    """Enhanced plotter with report generation and interactive tools."""
+    """Enhanced plotter with report generation and interactive tools.
+
+    The file is read in a background thread; ``data_ready`` is emitted once the
+    UI has been built, or ``load_failed`` with an error message.
+    """
+
+    data_ready = pyqtSignal()
+    load_failed = pyqtSignal(str)
 
     def __init__(self, file_path: Path) -> None:
         super().__init__()
         self._file_path = file_path
+        self._load_worker: DataFrameLoadWorker | None = None
+        self._export_worker: ReportExportWorker | None = None
         self._dataframe: pd.DataFrame | None = None
         self._filter_pipeline: DataFilterPipeline | None = None
         self._current_tool: BaseTool | None = None
         self._main_plot_section: ReportPlot | None = None
 
+        # Artists of the current main plot, reused by cosmetic toggles
+        self._plot_axes: Axes | None = None
+        self._plot_collection: LineCollection | None = None
+        self._legend_colors: List[str] = []
+        self._legend_labels: List[str] = []
+        self._plotted_signature: Tuple | None = None
+        self._plotted_data: pd.DataFrame | None = None
+        # Scratch buffer for per-series validity masks
+        self._valid_buf: np.ndarray = np.empty(0, dtype=bool)
+
+        # Coalesces bursts of selection changes into one replot
+        self._replot_timer = QTimer(self)
+        self._replot_timer.setSingleShot(True)
+        self._replot_timer.setInterval(50)
+        self._replot_timer.timeout.connect(self._update_main_plot)
+
         self.setWindowTitle(f"Enhanced Plotter - {self._file_path.name}")
         self.resize(1600, 1000)
 
+        # Placeholder until the data arrives
+        self._loading_label = QLabel(f"Loading {self._file_path.name}...")
+        self._loading_label.setAlignment(Qt.AlignCenter)
+        self._loading_label.setStyleSheet("color: #6B7280; font-size: 13px;")
+        self.setCentralWidget(self._loading_label)
+
         self._load_data()
-        self._build_ui()
-        self._create_initial_report()
 
     def _load_data(self) -> None:
-        """Load data from file."""
-        df = self._read_file(self._file_path)
+        """Start reading the file in a background thread."""
+        self._load_worker = DataFrameLoadWorker(self._file_path, self._read_file)
+        self._load_worker.loaded.connect(self._on_data_loaded)
+        self._load_worker.error.connect(self._on_load_failed)
+        self._load_worker.start()
+
+    def _on_data_loaded(self, df: pd.DataFrame) -> None:
+        """Build the UI around the loaded data."""
         if df.empty:
-            raise ValueError("The selected file did not contain any data to display.")
+            self._on_load_failed("The selected file did not contain any data to display.")
+            return
+
         self._dataframe = df
         self._filter_pipeline = DataFilterPipeline(df)
 
+        self._build_ui()
+        self._create_initial_report()
+        self.data_ready.emit()
+
+    def _on_load_failed(self, message: str) -> None:
+        """Show the load error in place of the UI."""
+        self._loading_label.setText(f"Unable to load data: {message}")
+        self.load_failed.emit(message)
+
     @staticmethod
     def _read_file(path: Path) -> pd.DataFrame:
-        """Read file and return DataFrame."""
+        """Read file and return DataFrame, reusing a recent parse if unchanged."""
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        with _FILE_CACHE_LOCK:
+            df = _FILE_CACHE.get(key)
+            if df is not None:
+                _FILE_CACHE.move_to_end(key)
+                return df
+
+        df = EnhancedPlotterWindow._parse_file(path)
+
+        with _FILE_CACHE_LOCK:
+            _FILE_CACHE[key] = df
+            while len(_FILE_CACHE) > _FILE_CACHE_SIZE:
+                _FILE_CACHE.popitem(last=False)
+        return df
+
+    @staticmethod
+    def _parse_file(path: Path) -> pd.DataFrame:
+        """Parse a supported file into a DataFrame."""
         ext = path.suffix.lower()
 
         if ext == ".parquet":
-            return pd.read_parquet(path, engine="pyarrow")
+            # Keep Arrow buffers; numeric columns convert to NumPy on demand
+            return pd.read_parquet(
+                path,
+                engine="pyarrow",
+                columns=_parquet_plot_columns(path),
+                dtype_backend="pyarrow",
+            )
         if ext == ".csv":
             return load_and_process_csv_file(str(path))
         if ext == ".tdms":
@@ -1143,17 +1543,19 @@ class EnhancedPlotterWindow(QMainWindow):
         layout.addWidget(QLabel("X-Axis:"))
         self.x_selector = QComboBox()
         self.x_selector.addItems(self._dataframe.columns.tolist())
-        self.x_selector.currentTextChanged.connect(self._update_main_plot)
+        self.x_selector.currentTextChanged.connect(self._schedule_main_plot)
         layout.addWidget(self.x_selector)
 
         # Y-Axes selector
         layout.addWidget(QLabel("Y-Axes (Multi-select):"))
         self.y_selector = QListWidget()
         self.y_selector.setSelectionMode(QAbstractItemView.MultiSelection)
-        numeric_cols = self._dataframe.select_dtypes(include=[np.number]).columns
-        for col in numeric_cols:
-            self.y_selector.addItem(col)
-        self.y_selector.itemSelectionChanged.connect(self._update_main_plot)
+        numeric_cols = self._dataframe.select_dtypes(include=[np.number]).columns.tolist()
+        # Insert in one batch so the list lays out once
+        self.y_selector.setUpdatesEnabled(False)
+        self.y_selector.addItems(numeric_cols)
+        self.y_selector.setUpdatesEnabled(True)
+        self.y_selector.itemSelectionChanged.connect(self._schedule_main_plot)
         layout.addWidget(self.y_selector)
 
         # Select first 2 by default
@@ -1174,7 +1576,7 @@ class EnhancedPlotterWindow(QMainWindow):
                 background: #1E40AF;
             }
         """)
-        update_btn.clicked.connect(self._update_main_plot)
+        update_btn.clicked.connect(self._refresh_main_plot)
         layout.addWidget(update_btn)
 
         return panel
@@ -1215,13 +1617,13 @@ class EnhancedPlotterWindow(QMainWindow):
         # Grid toggle
         self.grid_check = QCheckBox("Show Grid")
         self.grid_check.setChecked(True)
-        self.grid_check.stateChanged.connect(self._update_main_plot)
+        self.grid_check.stateChanged.connect(self._apply_grid_style)
         layout.addWidget(self.grid_check)
 
         # Legend toggle
         self.legend_check = QCheckBox("Show Legend")
         self.legend_check.setChecked(True)
-        self.legend_check.stateChanged.connect(self._update_main_plot)
+        self.legend_check.stateChanged.connect(self._apply_legend_style)
         layout.addWidget(self.legend_check)
 
         # Line width
@@ -1230,9 +1632,15 @@ class EnhancedPlotterWindow(QMainWindow):
         self.line_width_slider.setMinimum(1)
         self.line_width_slider.setMaximum(5)
         self.line_width_slider.setValue(2)
-        self.line_width_slider.valueChanged.connect(self._update_main_plot)
+        self.line_width_slider.valueChanged.connect(self._apply_line_width)
         layout.addWidget(self.line_width_slider)
 
+        # Normalized overlay: every series scaled to [0, 1] on the shared axis
+        self.normalize_check = QCheckBox("Normalize Series (0-1)")
+        self.normalize_check.setToolTip("Overlay series with different units; legend shows each true range")
+        self.normalize_check.stateChanged.connect(self._schedule_main_plot)
+        layout.addWidget(self.normalize_check)
+
         return panel
 
     def _create_analysis_panel(self) -> CollapsiblePanel:
@@ -1259,6 +1667,24 @@ class EnhancedPlotterWindow(QMainWindow):
 
         layout.addWidget(ma_group)
 
+        # Derived column
+        derived_group = QGroupBox("Derived Column")
+        derived_layout = QFormLayout(derived_group)
+
+        self.derived_name_edit = QLineEdit()
+        self.derived_name_edit.setPlaceholderText("New column name")
+        derived_layout.addRow("Name:", self.derived_name_edit)
+
+        self.derived_expr_edit = QLineEdit()
+        self.derived_expr_edit.setPlaceholderText("e.g. Pressure * 0.1")
+        derived_layout.addRow("Expression:", self.derived_expr_edit)
+
+        derived_btn = QPushButton("Add Column")
+        derived_btn.clicked.connect(self._add_derived_column)
+        derived_layout.addRow(derived_btn)
+
+        layout.addWidget(derived_group)
+
         # Add statistics section
         stats_btn = QPushButton("Add Statistics to Report")
         stats_btn.clicked.connect(self._add_statistics_section)
@@ -1289,6 +1715,30 @@ class EnhancedPlotterWindow(QMainWindow):
             f"Original rows: {orig_rows:,}\nFiltered rows: {filt_rows:,}\nRemoved: {orig_rows - filt_rows:,}"
         )
 
+    def _add_derived_column(self):
+        """Add a column computed from an expression over existing columns."""
+        name = self.derived_name_edit.text().strip()
+        expression = self.derived_expr_edit.text().strip()
+
+        if not name or not expression:
+            QMessageBox.warning(self, "Derived Column", "Enter both a column name and an expression.")
+            return
+
+        if name in self._filter_pipeline.original_data.columns:
+            QMessageBox.warning(self, "Derived Column", f"A column named '{name}' already exists.")
+            return
+
+        try:
+            self._filter_pipeline.add_derived_column(name, expression)
+        except Exception as e:
+            QMessageBox.warning(self, "Derived Column", f"Could not evaluate expression:\n{e}")
+            return
+
+        self.x_selector.addItem(name)
+        item = QListWidgetItem(name)
+        self.y_selector.addItem(item)
+        item.setSelected(True)
+
     def _reset_filters(self):
         """Reset all filters."""
         self._filter_pipeline.reset()
@@ -1314,11 +1764,16 @@ class EnhancedPlotterWindow(QMainWindow):
         self._main_plot_section = ReportPlot("Main Plot", self)
         self.report_area.add_section(self._main_plot_section)
 
-        # Initial plot
-        self._update_main_plot()
+        # Initial plot, deferred so the window paints before the first draw
+        QTimer.singleShot(0, self._update_main_plot)
+
+    def _schedule_main_plot(self):
+        """Update the main plot once the current burst of selection changes settles."""
+        self._replot_timer.start()
 
     def _update_main_plot(self):
         """Update the main plot."""
+        self._replot_timer.stop()
         if not self._main_plot_section:
             return
 
@@ -1329,59 +1784,193 @@ class EnhancedPlotterWindow(QMainWindow):
             return
 
         y_columns = [item.text() for item in y_items]
+        figure = self._main_plot_section.get_figure()
+
+        if (
+            self._plot_axes in figure.axes
+            and self._plot_signature(x_column, y_columns) == self._plotted_signature
+            and self._filter_pipeline.get_filtered_data() is self._plotted_data
+        ):
+            # Nothing changed since the last draw; styling toggles apply themselves
+            return
 
         try:
-            self._plot_data(
-                self._main_plot_section.get_figure(),
-                x_column,
-                y_columns
-            )
+            self._plot_data(figure, x_column, y_columns)
             self._main_plot_section.canvas.draw()
         except Exception as e:
             print(f"Error updating plot: {e}")
 
+    def _refresh_main_plot(self):
+        """Redraw the main plot even if the selection is unchanged."""
+        self._plotted_signature = None
+        self._update_main_plot()
+
+    def _plot_signature(self, x_column: str, y_columns: List[str]) -> Tuple:
+        """Get the options that determine the plotted series."""
+        moving_average = hasattr(self, 'ma_check') and self.ma_check.isChecked()
+        return (
+            x_column,
+            tuple(y_columns),
+            moving_average,
+            self.ma_window.value() if moving_average else None,
+            hasattr(self, 'normalize_check') and self.normalize_check.isChecked(),
+        )
+
     def _plot_data(self, figure: Figure, x_column: str, y_columns: List[str]):
         """Plot data on a figure."""
         df = self._filter_pipeline.get_filtered_data()
 
-        figure.clear()
-        ax = figure.add_subplot(111)
+        signature = self._plot_signature(x_column, y_columns)
+        moving_average = signature[2]
+        normalize = signature[4]
 
-        try:
-            x_data = pd.to_numeric(df[x_column], errors='coerce')
-        except:
-            x_data = df.index
+        ax = self._plot_axes
+        if ax is None or ax not in figure.axes:
+            figure.clear()
+            ax = figure.add_subplot(111)
+        else:
+            # Reuse the axes; only drop the previous data and tool artists
+            for artist in [*ax.lines, *ax.collections, *ax.patches, *ax.texts]:
+                artist.remove()
+            ax.ignore_existing_data_limits = True
 
-        # Color palette
-        colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
+        try:
+            x_data = self._filter_pipeline.get_numeric_array(x_column)
+        except (TypeError, ValueError):
+            x_data = np.arange(len(df), dtype=float)
+        x_valid = ~np.isnan(x_data)
+        x_any_valid = bool(x_valid.any())
+        if len(self._valid_buf) != len(x_valid):
+            self._valid_buf = np.empty(len(x_valid), dtype=bool)
+        valid = self._valid_buf
 
         line_width = self.line_width_slider.value() if hasattr(self, 'line_width_slider') else 2
 
+        # No point drawing more vertices than the canvas has pixels for
+        n_out = max(_MIN_DOWNSAMPLE_POINTS, int(figure.canvas.width() * 2))
+
+        # All series go into one LineCollection: one artist, one draw call
+        segments = []
+        segment_colors = []
+        antialiased = []
+        labels = []
+
         for i, column in enumerate(y_columns):
-            color = colors[i % len(colors)]
-            y_data = pd.to_numeric(df[column], errors='coerce')
+            if not x_any_valid:
+                break
+            y_data = self._filter_pipeline.get_plot_array(column)
 
-            valid = x_data.notna() & y_data.notna()
+            np.logical_and(x_valid, self._filter_pipeline.get_valid_mask(column), out=valid)
 
             if valid.any():
+                x_plot = x_data[valid]
+
                 # Apply moving average if enabled
-                if hasattr(self, 'ma_check') and self.ma_check.isChecked():
+                if moving_average:
                     window = self.ma_window.value()
-                    y_plot = y_data[valid].rolling(window=window).mean()
-                    ax.plot(x_data[valid], y_plot, color=color, label=f"{column} (MA{window})", linewidth=line_width, alpha=0.9)
+                    y_plot = pd.Series(y_data[valid]).rolling(window=window).mean().to_numpy()
+                    # The first window - 1 averages are undefined
+                    x_plot, y_plot = x_plot[window - 1:], y_plot[window - 1:]
+                    if len(x_plot) == 0:
+                        continue
+                    label = f"{column} (MA{window})"
                 else:
-                    ax.plot(x_data[valid], y_data[valid], color=color, label=column, linewidth=line_width, alpha=0.9)
+                    y_plot = y_data[valid]
+                    label = column
+
+                if normalize:
+                    y_min, y_max = float(np.min(y_plot)), float(np.max(y_plot))
+                    span = y_max - y_min
+                    y_plot = (y_plot - y_min) / span if span else np.zeros_like(y_plot)
+                    label = f"{label} [{y_min:.3g}, {y_max:.3g}]"
+                labels.append(label)
+
+                if len(x_plot) > n_out:
+                    keep = _downsample_lttb(x_plot, y_plot, n_out)
+                    x_plot, y_plot = x_plot[keep], y_plot[keep]
+
+                segments.append(np.column_stack([x_plot, y_plot]))
+                segment_colors.append(_SERIES_COLORS[i % len(_SERIES_COLORS)])
+                antialiased.append(len(x_plot) < _ANTIALIAS_MAX_POINTS)
+
+        collection = None
+        if segments:
+            collection = LineCollection(
+                segments,
+                colors=segment_colors,
+                linewidths=line_width,
+                alpha=0.9,
+                antialiaseds=antialiased,
+                joinstyle='bevel',
+                capstyle='butt',
+            )
+            ax.add_collection(collection)
+            ax.autoscale_view()
+
+        if pd.api.types.is_datetime64_any_dtype(df[x_column]):
+            locator = mdates.AutoDateLocator()
+            ax.xaxis.set_major_locator(locator)
+            ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+        elif isinstance(ax.xaxis.get_major_formatter(), mdates.ConciseDateFormatter):
+            # Axes are reused; drop date ticks left over from a timestamp x column
+            ax.xaxis.set_major_locator(AutoLocator())
+            ax.xaxis.set_major_formatter(ScalarFormatter())
 
         ax.set_xlabel(x_column, fontsize=11, fontweight='bold')
-        ax.set_ylabel("Value", fontsize=11, fontweight='bold')
+        ax.set_ylabel("Normalized Value" if normalize else "Value", fontsize=11, fontweight='bold')
+
+        self._plot_axes = ax
+        self._plot_collection = collection
+        self._plotted_signature = signature
+        self._plotted_data = df
+        self._legend_colors = segment_colors
+        self._legend_labels = labels
+
+        self._style_grid(ax)
+        self._style_legend(ax)
 
+    def _style_grid(self, ax: Axes):
+        """Apply the grid checkbox state to an axes."""
         if hasattr(self, 'grid_check') and self.grid_check.isChecked():
             ax.grid(True, alpha=0.3, linestyle='--')
+        else:
+            ax.grid(False)
+
+    def _style_legend(self, ax: Axes):
+        """Rebuild the legend from the cached entries per the legend checkbox."""
+        legend = ax.get_legend()
+        if legend is not None:
+            legend.remove()
+
+        if self._legend_labels and hasattr(self, 'legend_check') and self.legend_check.isChecked():
+            line_width = self.line_width_slider.value() if hasattr(self, 'line_width_slider') else 2
+            handles = [
+                Line2D([0], [0], color=color, linewidth=line_width) for color in self._legend_colors
+            ]
+            ax.legend(handles, self._legend_labels, loc='best', fontsize=9)
+
+    def _apply_grid_style(self):
+        """Toggle the grid on the current plot without replotting."""
+        if self._plot_axes is None:
+            return
+        self._style_grid(self._plot_axes)
+        self._main_plot_section.canvas.draw_idle()
 
-        if hasattr(self, 'legend_check') and self.legend_check.isChecked():
-            ax.legend(loc='best', fontsize=9)
+    def _apply_legend_style(self):
+        """Toggle the legend on the current plot without replotting."""
+        if self._plot_axes is None:
+            return
+        self._style_legend(self._plot_axes)
+        self._main_plot_section.canvas.draw_idle()
 
-        figure.tight_layout()
+    def _apply_line_width(self):
+        """Change line width on the current plot without replotting."""
+        if self._plot_axes is None:
+            return
+        if self._plot_collection is not None:
+            self._plot_collection.set_linewidth(self.line_width_slider.value())
+        self._style_legend(self._plot_axes)
+        self._main_plot_section.canvas.draw_idle()
 
     def _add_statistics_section(self):
         """Add statistics section to report."""
@@ -1390,10 +1979,9 @@ class EnhancedPlotterWindow(QMainWindow):
             return
 
         y_columns = [item.text() for item in y_items]
-        df = self._filter_pipeline.get_filtered_data()
 
         stats_section = ReportStatistics(self)
-        stats_section.update_stats(df[y_columns])
+        stats_section.update_stats(y_columns, self._filter_pipeline.get_column_stats())
         self.report_area.add_section(stats_section)
 
     def _export_report_pdf(self):
@@ -1405,12 +1993,85 @@ class EnhancedPlotterWindow(QMainWindow):
             "PDF Files (*.pdf)"
         )
 
-        if filepath:
-            success = self.report_area.export_to_pdf(filepath)
-            if success:
-                QMessageBox.information(self, "Export Success", f"Report exported to:\n{filepath}")
-            else:
-                QMessageBox.critical(self, "Export Failed", "Failed to export report. Check console for errors.")
+        if not filepath:
+            return
+
+        if self._export_worker is not None and self._export_worker.isRunning():
+            QMessageBox.information(self, "Export in Progress", "A report is already being exported.")
+            return
+
+        # Rasterising and writing happen off the GUI thread on a snapshot
+        contents = self.report_area.snapshot()
+        self._export_worker = ReportExportWorker(
+            filepath, lambda path: _build_report_pdf(path, contents)
+        )
+        self._export_worker.exported.connect(
+            lambda success: self._on_report_exported(filepath, success)
+        )
+        self._export_worker.error.connect(
+            lambda message: self._on_report_exported(filepath, False, message)
+        )
+        self._export_worker.start()
+
+    def _on_report_exported(self, filepath: str, success: bool, message: str = ""):
+        """Report the outcome of a background PDF export."""
+        if success:
+            QMessageBox.information(self, "Export Success", f"Report exported to:\n{filepath}")
+        elif message:
+            QMessageBox.critical(self, "Export Failed", f"Failed to export report:\n{message}")
+        else:
+            QMessageBox.critical(self, "Export Failed", "Failed to export report. Check console for errors.")
+
+
+# ============================================================================
+# LAZY EMBEDDABLE PLOTTER
+# ============================================================================
+
+class LazyPlotterWidget(QWidget):
+    """Lightweight placeholder that builds the plotter the first time it is shown."""
+
+    def __init__(self, file_path: Path, parent=None):
+        super().__init__(parent)
+        self._file_path = Path(file_path)
+        self._window: EnhancedPlotterWindow | None = None
+        self._built = False
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self._placeholder = QLabel(f"Loading {self._file_path.name}...")
+        self._placeholder.setAlignment(Qt.AlignCenter)
+        self._placeholder.setStyleSheet("color: #6B7280; font-size: 13px;")
+        layout.addWidget(self._placeholder)
+
+    def showEvent(self, event):
+        """Build the plotter contents on first show."""
+        super().showEvent(event)
+        if not self._built:
+            self._built = True
+            # Let the placeholder paint before loading data and drawing
+            QTimer.singleShot(0, self._build_contents)
+
+    def _build_contents(self):
+        """Start loading the data; the plotter UI is swapped in once ready."""
+        try:
+            self._window = EnhancedPlotterWindow(self._file_path)
+        except Exception as e:
+            print(f"Error creating plotter widget: {e}")
+            self._placeholder.setText(f"Unable to open plotter: {e}")
+            return
+
+        self._window.data_ready.connect(self._attach_contents)
+        self._window.load_failed.connect(
+            lambda message: self._placeholder.setText(f"Unable to open plotter: {message}")
+        )
+
+    def _attach_contents(self):
+        """Swap the placeholder for the loaded plotter UI."""
+        layout = self.layout()
+        layout.removeWidget(self._placeholder)
+        self._placeholder.deleteLater()
+        layout.addWidget(self._window.centralWidget())
 
 
 # ============================================================================
@@ -1433,12 +2094,16 @@ def run(file_path: Path | str) -> None:
 
     try:
         window = EnhancedPlotterWindow(path)
+
+        def _on_load_failed(message: str) -> None:
+            QMessageBox.warning(window, "Plotter", message)
+            window.close()
+
+        window.load_failed.connect(_on_load_failed)
         window.show()
         window.raise_()
         window.activateWindow()
         _open_windows.append(window)
-    except ValueError as exc:
-        QMessageBox.warning(None, "Plotter", str(exc))
     except Exception as exc:
         QMessageBox.critical(None, "Plotter", f"Unable to open plotter: {exc}")
         import traceback
@@ -1452,13 +2117,12 @@ def create_plotter_widget(file_path: Path) -> Optional[QWidget]:
         file_path: Path to the file to plot
 
     Returns:
-        QWidget containing basic plotter, or None if creation fails
+        QWidget that builds the plotter when first shown, or None if creation fails
     """
     # This function maintains backward compatibility
     # For new code, use run() to launch the full enhanced plotter
     try:
-        window = EnhancedPlotterWindow(file_path)
-        return window.centralWidget()
+        return LazyPlotterWidget(file_path)
     except Exception as e:
         print(f"Error creating plotter widget: {e}")
         return None
\ No newline at end of file
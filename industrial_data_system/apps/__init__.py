@@ -1,6 +1,45 @@
-"""High-level application entry points for Industrial Data System user interfaces."""
+"""High-level application entry points for Industrial Data System user interfaces.
 
-from industrial_data_system.apps.desktop.reader import ReaderApp
-from industrial_data_system.apps.desktop.uploader import IndustrialTheme, IndustrialDataApp
+The applications are imported on first attribute access, so importing this
+package does not load the GUI stack until an application is actually used.
+Accessing ``ReaderApp`` or ``IndustrialDataApp`` imports PyQt5 and the
+corresponding desktop module; ``IndustrialTheme`` is plain Python.
+
+Set ``IDS_EAGER_IMPORT=1`` to resolve every export at import time instead, so
+CI and debugging sessions surface broken deferred imports immediately.
+"""
+
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from industrial_data_system.apps.desktop.reader import ReaderApp
+    from industrial_data_system.apps.desktop.theme import IndustrialTheme
+    from industrial_data_system.apps.desktop.uploader import IndustrialDataApp
 
 __all__ = ["ReaderApp", "IndustrialDataApp", "IndustrialTheme"]
+
+
+def __getattr__(name):
+    if name == "ReaderApp":
+        from industrial_data_system.apps.desktop.reader import ReaderApp as value
+    elif name == "IndustrialDataApp":
+        from industrial_data_system.apps.desktop.uploader import IndustrialDataApp as value
+    elif name == "IndustrialTheme":
+        from industrial_data_system.apps.desktop.theme import IndustrialTheme as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache on the module so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if os.getenv("IDS_EAGER_IMPORT") == "1":
+    for _name in __all__:
+        __getattr__(_name)
+    del _name
@@ -0,0 +1,5 @@
+from industrial_data_system.apps.desktop.reader import ReaderApp as ReaderApp
+from industrial_data_system.apps.desktop.uploader import IndustrialDataApp as IndustrialDataApp
+from industrial_data_system.apps.desktop.theme import IndustrialTheme as IndustrialTheme
+
+__all__ = ["ReaderApp", "IndustrialDataApp", "IndustrialTheme"]
@@ -1,6 +1,34 @@
-"""Desktop GUI applications for the Industrial Data System."""
+"""Desktop GUI applications for the Industrial Data System.
 
-from .reader import ReaderApp
-from .uploader import IndustrialDataApp, IndustrialTheme
+Each application module is imported on first attribute access; accessing
+``ReaderApp`` or ``IndustrialDataApp`` imports PyQt5, while ``IndustrialTheme``
+is plain Python.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .reader import ReaderApp
+    from .theme import IndustrialTheme
+    from .uploader import IndustrialDataApp
 
 __all__ = ["ReaderApp", "IndustrialDataApp", "IndustrialTheme"]
+
+
+def __getattr__(name):
+    if name == "ReaderApp":
+        from .reader import ReaderApp as value
+    elif name == "IndustrialDataApp":
+        from .uploader import IndustrialDataApp as value
+    elif name == "IndustrialTheme":
+        from .theme import IndustrialTheme as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache on the module so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,5 @@
+from .reader import ReaderApp as ReaderApp
+from .uploader import IndustrialDataApp as IndustrialDataApp
+from .theme import IndustrialTheme as IndustrialTheme
+
+__all__ = ["ReaderApp", "IndustrialDataApp", "IndustrialTheme"]
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import os
-import shutil
 import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
-from PyQt5.QtCore import Qt, QTimer, QUrl, pyqtSignal
-from PyQt5.QtGui import QDesktopServices, QFont, QPixmap
+from PyQt5.QtCore import QAbstractItemModel, QAbstractTableModel, QEvent, QModelIndex, Qt, QTimer, QUrl, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QDesktopServices, QFont, QImage, QPixmap
 from PyQt5.QtWidgets import (
     QApplication,
     QDialog,
@@ -28,11 +32,9 @@ from PyQt5.QtWidgets import (
     QScrollArea,
     QSplitter,
     QStackedWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTabWidget,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
@@ -42,16 +44,25 @@ from industrial_data_system.Integrations.toolkit import (  # run_ai_data_study,;
     create_plotter_widget,
     run_test_app
 )
-from industrial_data_system.apps.desktop.uploader import IndustrialTheme
+from industrial_data_system.apps.desktop.theme import IndustrialTheme
 from industrial_data_system.core.auth import LocalAuthStore, LocalUser, SessionManager
 from industrial_data_system.core.config import get_config
 from industrial_data_system.core.db_manager import DatabaseManager
 from industrial_data_system.core.storage import LocalStorageManager
+from industrial_data_system.core.workers import (
+    DataFrameLoadWorker,
+    FileCopyWorker,
+    LoginWorker,
+    ResourceCollectWorker,
+)
 
 
+@lru_cache(maxsize=1)
 def get_reader_security_code() -> str:
     """Get the reader security code from environment variable.
 
+    The value is read once per process; a missing variable is not cached.
+
     Returns:
         str: The security code from IDS_READER_SECURITY_CODE environment variable.
 
@@ -67,7 +78,42 @@ def get_reader_security_code() -> str:
     return code.strip()
 
 
-@dataclass
+# File suffixes previewed as images and as plain text
+_IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".bmp", ".gif"})
+_TEXT_EXTENSIONS = frozenset({".txt", ".csv", ".json", ".log", ".md"})
+
+# Number of scaled image previews kept in memory
+_PIXMAP_CACHE_SIZE = 32
+
+# Bytes of a text file shown in the preview
+_TEXT_PREVIEW_BYTES = 12000
+
+# Rows of a parquet file shown in the preview
+_PARQUET_PREVIEW_ROWS = 1000
+
+# Concurrent directory listings when collecting resources
+_SCAN_WORKERS = 8
+
+# Input events that count as session activity
+_ACTIVITY_EVENTS = frozenset({QEvent.KeyPress, QEvent.MouseButtonPress, QEvent.Wheel})
+
+# Seconds between session activity updates while the user is active
+_ACTIVITY_FLUSH_INTERVAL = 5.0
+
+# Seconds a collected resource list is reused by non-forced refreshes
+_RESOURCE_CACHE_TTL = 30.0
+
+# Seconds the shared drive status from the last stat is trusted
+_DRIVE_STATUS_TTL = 2.0
+
+# Milliseconds a status bar notification stays visible
+_NOTIFICATION_MS = 4000
+
+# Milliseconds security events are queued before being written together
+_AUDIT_FLUSH_MS = 500
+
+
+@dataclass(slots=True)
 class LocalResource:
     """Representation of a file stored on the shared drive."""
 
@@ -230,6 +276,7 @@ class ReaderLoginPage(QWidget):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(scroll)
 
+    @pyqtSlot()
     def _emit_login(self) -> None:
         self.error_label.hide()
         email = self.email_input.text().strip().lower()
@@ -325,6 +372,202 @@ class ReaderSignupDialog(QDialog):
         }
 
 
+class PandasModel(QAbstractTableModel):
+    """Table model serving DataFrame cells only for the rows being painted."""
+
+    def __init__(self, df=None, parent=None):
+        super().__init__(parent)
+        self._headers: List[str] = []
+        self._values = None
+        if df is not None:
+            self._load(df)
+
+    def set_dataframe(self, df) -> None:
+        """Replace the previewed DataFrame, including its index as first column."""
+        self.beginResetModel()
+        self._load(df)
+        self.endResetModel()
+
+    def _load(self, df) -> None:
+        df = df.reset_index()
+        self._headers = df.columns.astype(str).tolist()
+        # Plain object array so painting avoids pandas' per-cell indexer overhead
+        self._values = df.to_numpy(dtype=object)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid() or self._values is None:
+            return 0
+        return self._values.shape[0]
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid() or self._values is None:
+            return 0
+        return self._values.shape[1]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or self._values is None:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        value = self._values[index.row(), index.column()]
+        return value if isinstance(value, str) else str(value)
+
+
+class _ResourceNode:
+    """Folder or file row of :class:`ResourceTreeModel`."""
+
+    __slots__ = ("parent", "row", "columns", "resource", "children", "pending")
+
+    def __init__(
+            self,
+            parent: Optional["_ResourceNode"],
+            row: int,
+            columns: Tuple[str, ...],
+            resource: Optional[LocalResource] = None,
+    ) -> None:
+        self.parent = parent
+        self.row = row
+        self.columns = columns
+        self.resource = resource
+        self.children: List["_ResourceNode"] = []
+        # Resources below a folder whose rows have not been built yet
+        self.pending: Optional[List[LocalResource]] = None
+
+
+class ResourceTreeModel(QAbstractItemModel):
+    """Folder tree over collected resources without per-row Qt items.
+
+    Top-level folders are created up front; the rows below one are only
+    built the first time the view asks for them.
+    """
+
+    HEADERS = ["Name", "Type", "Series", "Path"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._root = _ResourceNode(None, 0, ())
+
+    def set_resources(self, resources: Iterable[LocalResource]) -> None:
+        """Replace the tree contents in a single model reset."""
+        root = _ResourceNode(None, 0, ())
+        series: Dict[str, List[LocalResource]] = {}
+        loose_files: List[LocalResource] = []
+
+        for resource in resources:
+            if len(resource.relative_path.parts) > 1:
+                series.setdefault(resource.relative_path.parts[0], []).append(resource)
+            else:
+                loose_files.append(resource)
+
+        for folder_name, series_resources in series.items():
+            folder = _ResourceNode(root, len(root.children), (folder_name, "Folder", "", ""))
+            folder.pending = series_resources
+            root.children.append(folder)
+        self._build_children(root, loose_files, 0)
+
+        self.beginResetModel()
+        self._root = root
+        self.endResetModel()
+
+    def resource(self, index: QModelIndex) -> Optional[LocalResource]:
+        """Return the file behind ``index``, or None for folders."""
+        if not index.isValid():
+            return None
+        return index.internalPointer().resource
+
+    @staticmethod
+    def _build_children(
+            parent: _ResourceNode,
+            resources: Iterable[LocalResource],
+            depth: int,
+    ) -> None:
+        """Add rows below ``parent``, skipping ``depth`` leading folders of each path."""
+        # Folders are keyed by their path parts, so no key strings are built per file
+        folders: Dict[Tuple[str, ...], _ResourceNode] = {}
+        # Type labels per suffix; most folders repeat the same few file types
+        type_labels: Dict[str, str] = {}
+
+        for resource in resources:
+            node = parent
+            parts = resource.relative_path.parts
+            for index in range(depth, len(parts) - 1):
+                path_key = parts[:index + 1]
+                folder = folders.get(path_key)
+                if folder is None:
+                    folder = _ResourceNode(
+                        node,
+                        len(node.children),
+                        (parts[index], "Folder", "", "/".join(parts[:index])),
+                    )
+                    node.children.append(folder)
+                    folders[path_key] = folder
+                node = folder
+
+            suffix = resource.absolute_path.suffix
+            type_label = type_labels.get(suffix)
+            if type_label is None:
+                type_label = type_labels[suffix] = suffix.replace(".", "").upper() or "File"
+
+            node.children.append(
+                _ResourceNode(
+                    node,
+                    len(node.children),
+                    (resource.display_name, type_label, resource.pump_series, resource.folder),
+                    resource,
+                )
+            )
+
+    def _node(self, index: QModelIndex) -> _ResourceNode:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def _children(self, node: _ResourceNode) -> List[_ResourceNode]:
+        if node.pending is not None:
+            resources, node.pending = node.pending, None
+            self._build_children(node, resources, 1)
+        return node.children
+
+    def index(self, row, column, parent=QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column, self._children(self._node(parent))[row])
+
+    def parent(self, index=QModelIndex()) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return len(self._children(self._node(parent)))
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return len(self.HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()) -> bool:
+        node = self._node(parent)
+        # Unbuilt folders report children without building them
+        return node.pending is not None or bool(node.children)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return index.internalPointer().columns[index.column()]
+
+
 class ReaderDashboard(QWidget):
     """Main dashboard for browsing local resources."""
 
@@ -373,9 +616,11 @@ class ReaderDashboard(QWidget):
         tree_header.setStyleSheet(f"font-weight: 600; font-size: 14px; color: {IndustrialTheme.TEXT_PRIMARY};")
         tree_layout.addWidget(tree_header)
 
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabels(["Name", "Type", "Series", "Path"])
+        self.tree_model = ResourceTreeModel()
+        self.tree = QTreeView()
+        self.tree.setModel(self.tree_model)
         self.tree.setAlternatingRowColors(True)
+        self.tree.setUniformRowHeights(True)
         self.tree.header().setSectionResizeMode(0, self.tree.header().Stretch)
         tree_layout.addWidget(self.tree)
 
@@ -412,9 +657,14 @@ class ReaderDashboard(QWidget):
         preview_content_layout.addWidget(self.text_preview)
 
         # Table preview for parquet files
-        self.table_preview = QTableWidget()
-        self.table_preview.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table_model = PandasModel()
+        self.table_preview = QTableView()
+        self.table_preview.setModel(self.table_model)
+        self.table_preview.setEditTriggers(QTableView.NoEditTriggers)
         self.table_preview.setAlternatingRowColors(True)
+        # Fixed sizes so Qt never measures every cell's text
+        self.table_preview.verticalHeader().setDefaultSectionSize(20)
+        self.table_preview.horizontalHeader().setDefaultSectionSize(120)
         self.table_preview.hide()
         preview_content_layout.addWidget(self.table_preview)
 
@@ -465,10 +715,31 @@ class ReaderDashboard(QWidget):
         splitter.setStretchFactor(1, 4)
         main_layout.addWidget(splitter, stretch=1)
 
-        self.tree.currentItemChanged.connect(self._handle_selection)
+        self.tree.selectionModel().currentChanged.connect(self._handle_selection)
+        self.tree.expanded.connect(self._handle_expanded)
 
         self._current_resource: Optional[LocalResource] = None
         self._tool_outputs: Dict[str, QPlainTextEdit] = {}
+        # Previews are read off the GUI thread; only the latest one is shown
+        self._preview_generation = 0
+        self._preview_workers: Set[DataFrameLoadWorker] = set()
+        # Scaled image previews keyed by (path, mtime_ns), least recently used first
+        self._pixmap_cache: "OrderedDict[Tuple[str, int], QPixmap]" = OrderedDict()
+        self._download_worker: Optional[FileCopyWorker] = None
+
+        # Preview handler per lower-case file suffix
+        self._preview_handlers: Dict[str, Callable[[Path], None]] = {
+            ".parquet": self._preview_parquet,
+        }
+        self._preview_handlers.update(dict.fromkeys(_IMAGE_EXTENSIONS, self._preview_image))
+        self._preview_handlers.update(dict.fromkeys(_TEXT_EXTENSIONS, self._preview_text))
+
+        # Coalesces rapid selection changes (e.g. a held arrow key) into one preview
+        self._pending_resource: Optional[LocalResource] = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(150)
+        self._preview_timer.timeout.connect(self._do_pending_preview)
 
     def set_user_identity(self, display_name: str, email: str) -> None:
         if display_name:
@@ -478,7 +749,9 @@ class ReaderDashboard(QWidget):
         self.user_label.setText(text or "Reader Dashboard")
 
     def clear(self) -> None:
-        self.tree.clear()
+        self._preview_timer.stop()
+        self._preview_generation += 1
+        self.tree_model.set_resources([])
         self._show_message("Select a file to preview")
         self.image_preview.hide()
         self.text_preview.hide()
@@ -486,31 +759,10 @@ class ReaderDashboard(QWidget):
         self._current_resource = None
 
     def _show_table(self, df):
-        self.table_preview.clear()
-
-        # Include index as first column
-        df_with_index = df.reset_index()
-
-        self.table_preview.setRowCount(df_with_index.shape[0])
-        self.table_preview.setColumnCount(df_with_index.shape[1])
-
-        # Set headers
-        headers = df_with_index.columns.astype(str).tolist()
-        self.table_preview.setHorizontalHeaderLabels(headers)
-
-        # Fill table cells
-        for row in range(df_with_index.shape[0]):
-            for col in range(df_with_index.shape[1]):
-                item = QTableWidgetItem(str(df_with_index.iat[row, col]))
-                self.table_preview.setItem(row, col, item)
-
-        # Auto-resize columns
-        self.table_preview.resizeColumnsToContents()
+        # The model includes the index as first column
+        self.table_model.set_dataframe(df)
         self.table_preview.setColumnWidth(0, 60)  # Index column
 
-        # IMPORTANT: Resize rows to content
-        self.table_preview.resizeRowsToContents()
-
         # Show table and hide others
         self.table_preview.show()
         self.text_preview.hide()
@@ -521,60 +773,33 @@ class ReaderDashboard(QWidget):
 
     def populate(self, resources: Iterable[LocalResource]) -> None:
         self.clear()
-        folders: Dict[str, QTreeWidgetItem] = {}
-        root = self.tree.invisibleRootItem()
-
-        for resource in resources:
-            parent = root
-            path_so_far: List[str] = []
-            parts = list(resource.relative_path.parts)
-            for folder_name in parts[:-1]:
-                path_so_far.append(folder_name)
-                path_key = "/".join(path_so_far)
-                if path_key not in folders:
-                    folder_item = QTreeWidgetItem(
-                        [folder_name, "Folder", "", "/".join(path_so_far[:-1])]
-                    )
-                    folder_item.setData(0, Qt.UserRole, {"type": "folder"})
-                    parent.addChild(folder_item)
-                    folders[path_key] = folder_item
-                parent = folders[path_key]
-
-            file_item = QTreeWidgetItem(
-                [
-                    resource.display_name,
-                    resource.absolute_path.suffix.replace(".", "").upper() or "File",
-                    resource.pump_series,
-                    resource.folder,
-                ]
-            )
-            file_item.setData(0, Qt.UserRole, {"type": "file", "resource": resource})
-            parent.addChild(file_item)
-
-        self.tree.expandAll()
-        if self.tree.topLevelItemCount() == 0:
+        self.tree_model.set_resources(resources)
+        if self.tree_model.rowCount() == 0:
             self._show_message("No files were found on the shared drive.")
 
-    def _handle_selection(
-        self, current: Optional[QTreeWidgetItem], _: Optional[QTreeWidgetItem]
-    ) -> None:
-        if not current:
-            self._current_resource = None
-            self.download_button.setEnabled(False)
-            self._show_message("Select a file to preview")
-            return
+    def _handle_expanded(self, index: QModelIndex) -> None:
+        # Opening a series shows its whole folder structure down to the files
+        if not index.parent().isValid():
+            self.tree.expandRecursively(index)
 
-        data = current.data(0, Qt.UserRole) or {}
-        if data.get("type") != "file":
+    @pyqtSlot(QModelIndex, QModelIndex)
+    def _handle_selection(self, current: QModelIndex, _: QModelIndex) -> None:
+        resource = self.tree_model.resource(current)
+        if resource is None:
+            self._preview_timer.stop()
             self._current_resource = None
             self.download_button.setEnabled(False)
             self._show_message("Select a file to preview")
             return
 
-        resource: LocalResource = data["resource"]
         self._current_resource = resource
         self.download_button.setEnabled(True)
-        self._preview_resource(resource)
+        self._pending_resource = resource
+        self._preview_timer.start()
+
+    def _do_pending_preview(self) -> None:
+        if self._pending_resource is not None:
+            self._preview_resource(self._pending_resource)
 
     def _launch_tool(
             self,
@@ -661,67 +886,111 @@ class ReaderDashboard(QWidget):
         self.open_tool_in_tab.emit(title, tool_widget)
 
     def _preview_resource(self, resource: LocalResource) -> None:
+        self._preview_generation += 1
         self.image_preview.hide()
         self.text_preview.hide()
         self.table_preview.hide()
 
         path = resource.absolute_path
-        if not path.exists():
-            self._show_message("File is not accessible on the shared drive.")
-            return
+        handler = self._preview_handlers.get(path.suffix.lower(), self._preview_unsupported)
+        handler(path)
+
+    def _preview_image(self, path: Path) -> None:
+        # Cached keys are passed by value; the worker only reads its own copy
+        cached_keys = frozenset(self._pixmap_cache)
+        self._start_preview(
+            path,
+            lambda image_path: _load_image_preview(image_path, cached_keys),
+            "Unable to load image preview",
+            self._show_image_preview,
+        )
 
-        suffix = path.suffix.lower()
-        image_ext = {".png", ".jpg", ".jpeg", ".bmp", ".gif"}
-        text_ext = {".txt", ".csv", ".json", ".log", ".md"}
+    def _preview_text(self, path: Path) -> None:
+        self._start_preview(path, _read_text_preview, "Unable to read file", self._show_text_preview)
 
-        if suffix in image_ext:
-            pixmap = QPixmap(str(path))
-            if pixmap.isNull():
-                self._show_message("Unable to load image preview.")
-                return
-            self.image_preview.setPixmap(
-                pixmap.scaled(640, 480, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            )
-            self.image_preview.show()
-            self._show_message("Image preview")
-            return
+    def _preview_parquet(self, path: Path) -> None:
+        self._start_preview(
+            path,
+            _read_parquet_preview,
+            "Unable to read parquet file",
+            self._show_parquet_preview,
+        )
 
-        if suffix in text_ext:
-            try:
-                with open(path, "r", encoding="utf-8", errors="replace") as handle:
-                    text = handle.read(12000)
-                    if handle.read(1):
-                        text += "\n\n… Preview truncated."
-            except Exception as exc:
-                self._show_message(f"Unable to read file: {exc}")
-                return
-            self.text_preview.setPlainText(text)
-            self.text_preview.show()
-            self._show_message("Text preview")
-            return
+    def _preview_unsupported(self, _: Path) -> None:
+        self._show_message("No preview available for this file type.")
 
-        # Add parquet preview
-        if suffix == ".parquet":
-            try:
-                import pandas as pd
+    def _start_preview(
+            self,
+            path: Path,
+            loader: Callable[[Path], object],
+            error_prefix: str,
+            on_loaded: Callable[[object], None],
+    ) -> None:
+        """Read a preview in a background thread and show it when it arrives.
 
-                df = pd.read_parquet(path, engine="pyarrow")
-            except Exception as exc:
-                self._show_message(f"Unable to read parquet file: {exc}")
-                return
+        Results of a preview that a newer selection replaced are dropped.
+        """
+        generation = self._preview_generation
+        self._show_message(f"Loading preview of {path.name}...")
 
-            # Check if DataFrame is empty
-            if len(df) == 0:
-                self._show_message("Parquet file is empty.")
+        worker = DataFrameLoadWorker(path, loader)
+        worker.loaded.connect(
+            lambda data: on_loaded(data) if generation == self._preview_generation else None
+        )
+        worker.error.connect(
+            lambda message: self._preview_failed(generation, f"{error_prefix}: {message}")
+        )
+        worker.finished.connect(lambda: self._preview_workers.discard(worker))
+        self._preview_workers.add(worker)
+        worker.start()
+
+    def stop_previews(self) -> None:
+        """Drop pending previews and wait for running preview threads to end."""
+        self._preview_timer.stop()
+        self._preview_generation += 1
+        for worker in list(self._preview_workers):
+            worker.quit()
+            worker.wait()
+        self._preview_workers.clear()
+
+    def _show_text_preview(self, text: str) -> None:
+        self.text_preview.setPlainText(text)
+        self.text_preview.show()
+        self._show_message("Text preview")
+
+    def _show_image_preview(self, result: Tuple[Tuple[str, int], Optional[QImage]]) -> None:
+        key, image = result
+        if image is None:
+            pixmap = self._pixmap_cache.get(key)
+            if pixmap is None:
+                # Evicted while the worker ran; decode it again
+                self._preview_image(Path(key[0]))
                 return
-
-            # Limit preview to first 1000 rows
-            df_preview = df.head(1000)
-            self._show_table(df_preview)
-            self._show_message(f"Parquet preview (showing {len(df_preview)} of {len(df)} rows)")
+            self._pixmap_cache.move_to_end(key)
+        else:
+            # Pixmaps may only be created on the GUI thread
+            pixmap = QPixmap.fromImage(image)
+            self._pixmap_cache[key] = pixmap
+            while len(self._pixmap_cache) > _PIXMAP_CACHE_SIZE:
+                self._pixmap_cache.popitem(last=False)
+
+        self.image_preview.setPixmap(pixmap)
+        self.image_preview.show()
+        self._show_message("Image preview")
+
+    def _show_parquet_preview(self, result: Tuple[object, int]) -> None:
+        df_preview, total_rows = result
+        # Check if DataFrame is empty
+        if total_rows == 0:
+            self._show_message("Parquet file is empty.")
             return
 
-        self._show_message("No preview available for this file type.")
+        self._show_table(df_preview)
+        self._show_message(f"Parquet preview (showing {len(df_preview)} of {total_rows} rows)")
+
+    def _preview_failed(self, generation: int, message: str) -> None:
+        if generation == self._preview_generation:
+            self._show_message(message)
 
     def _show_message(self, text: str) -> None:
         self.message_label.setText(text)
@@ -732,6 +1001,10 @@ class ReaderDashboard(QWidget):
             QMessageBox.information(self, "Download", "No file is selected.")
             return
 
+        if self._download_worker is not None and self._download_worker.isRunning():
+            QMessageBox.information(self, "Download", "A download is already in progress.")
+            return
+
         src_path = self._current_resource.absolute_path
         if not src_path.exists():
             QMessageBox.warning(
@@ -751,19 +1024,133 @@ class ReaderDashboard(QWidget):
         if not dest_path:
             return
 
-        try:
-            shutil.copy2(src_path, dest_path)
-            QMessageBox.information(
-                self,
-                "Download",
-                f"File saved successfully to:\n{dest_path}",
-            )
-        except Exception as exc:
-            QMessageBox.critical(
-                self,
-                "Download Failed",
-                f"Failed to copy file:\n{exc}",
+        # Large files would otherwise freeze the UI for the whole copy
+        self.download_button.setEnabled(False)
+        self.download_button.setText("Downloading...")
+        self._download_worker = FileCopyWorker(src_path, Path(dest_path))
+        self._download_worker.copied.connect(self._on_download_finished)
+        self._download_worker.error.connect(self._on_download_failed)
+        self._download_worker.start()
+
+    def _on_download_finished(self, dest_path: str) -> None:
+        self._reset_download_button()
+        QMessageBox.information(
+            self,
+            "Download",
+            f"File saved successfully to:\n{dest_path}",
+        )
+
+    def _on_download_failed(self, message: str) -> None:
+        self._reset_download_button()
+        QMessageBox.critical(
+            self,
+            "Download Failed",
+            f"Failed to copy file:\n{message}",
+        )
+
+    def _reset_download_button(self) -> None:
+        self.download_button.setText("Download")
+        self.download_button.setEnabled(self._current_resource is not None)
+
+
+def _stat_preview_file(path: Path) -> os.stat_result:
+    """Stat a file about to be previewed, reporting a missing one plainly."""
+    try:
+        return path.stat()
+    except OSError:
+        raise OSError("file is not accessible on the shared drive") from None
+
+
+def _load_image_preview(
+        path: Path, cached_keys: FrozenSet[Tuple[str, int]]
+) -> Tuple[Tuple[str, int], Optional[QImage]]:
+    """Decode an image and scale it down for preview.
+
+    Returns the cache key with no image when that key is in ``cached_keys``.
+    """
+    key = (str(path), _stat_preview_file(path).st_mtime_ns)
+    if key in cached_keys:
+        return key, None
+
+    image = QImage(str(path))
+    if image.isNull():
+        raise ValueError("unsupported or corrupt image")
+    return key, image.scaled(640, 480, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def _read_text_preview(path: Path) -> str:
+    """Read the head of a text file for preview."""
+    # The size is already known, so no extra read is needed to detect truncation
+    truncated = _stat_preview_file(path).st_size > _TEXT_PREVIEW_BYTES
+    with open(path, "rb") as handle:
+        raw = handle.read(_TEXT_PREVIEW_BYTES)
+    text = raw.decode("utf-8", errors="replace")
+    if truncated:
+        text += "\n\n… Preview truncated."
+    return text
+
+
+def _read_parquet_preview(path: Path) -> Tuple[object, int]:
+    """Read the first rows of a parquet file along with its total row count."""
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    _stat_preview_file(path)
+    parquet_file = pq.ParquetFile(path)
+    # The row count comes from the footer, so only the previewed rows are read
+    total_rows = parquet_file.metadata.num_rows
+
+    batches = []
+    rows = 0
+    for batch in parquet_file.iter_batches(batch_size=_PARQUET_PREVIEW_ROWS):
+        batches.append(batch)
+        rows += batch.num_rows
+        if rows >= _PARQUET_PREVIEW_ROWS:
+            break
+
+    table = pa.Table.from_batches(batches, schema=parquet_file.schema_arrow)
+    df = table.to_pandas().head(_PARQUET_PREVIEW_ROWS)
+
+    # A stored RangeIndex only survives a full read, so rebuild it for the head
+    index_columns = (parquet_file.schema_arrow.pandas_metadata or {}).get("index_columns", [])
+    if len(index_columns) == 1 and isinstance(index_columns[0], dict):
+        stored = index_columns[0]
+        if stored.get("kind") == "range":
+            start, step = stored["start"], stored["step"]
+            df.index = pd.RangeIndex(
+                start, start + step * len(df), step, name=stored.get("name")
             )
+    return df, total_rows
+
+
+def _candidate_paths(record, base_path: Path) -> List[Tuple[Path, Path]]:
+    """Return the (absolute, relative) locations a record's file may be at, in order."""
+    # Get the file path from the database record
+    # The file_path in the database should be relative to base_path
+    if hasattr(record, 'file_path') and record.file_path:
+        # Use the stored file_path
+        return [(base_path / record.file_path, Path(record.file_path))]
+
+    # Fallback to constructing path from pump_series/test_type/filename
+    # Check if there's a 'tests' subdirectory (legacy structure)
+    pump_series_dir = base_path / record.pump_series
+
+    # Try both structures: pump_series/tests/test_type and pump_series/test_type
+    possible_paths = [
+        pump_series_dir / "tests" / record.test_type / record.filename,
+        pump_series_dir / record.test_type / record.filename,
+    ]
+    return [(path, path.relative_to(base_path)) for path in possible_paths]
+
+
+def _list_directory(directory: Path) -> Dict[str, os.DirEntry]:
+    """Map the normalised names in ``directory`` to their entries."""
+    try:
+        with os.scandir(directory) as it:
+            return {os.path.normcase(entry.name): entry for entry in it}
+    except OSError:
+        return {}
 
 
 def _collect_resources(
@@ -773,40 +1160,33 @@ def _collect_resources(
     """Collect all uploaded resources from the shared drive."""
     resources: List[LocalResource] = []
     upload_records = db_manager.list_uploads()
-
-    for record in upload_records:
-        # Get the file path from the database record
-        # The file_path in the database should be relative to base_path
-        if hasattr(record, 'file_path') and record.file_path:
-            # Use the stored file_path
-            absolute_path = storage_manager.base_path / record.file_path
-            relative_path = Path(record.file_path)
-        else:
-            # Fallback to constructing path from pump_series/test_type/filename
-            # Check if there's a 'tests' subdirectory (legacy structure)
-            pump_series_dir = storage_manager.base_path / record.pump_series
-
-            # Try both structures: pump_series/tests/test_type and pump_series/test_type
-            possible_paths = [
-                pump_series_dir / "tests" / record.test_type / record.filename,
-                pump_series_dir / record.test_type / record.filename,
-            ]
-
-            absolute_path = None
-            for path in possible_paths:
-                if path.exists():
-                    absolute_path = path
-                    relative_path = path.relative_to(storage_manager.base_path)
-                    break
-
-            if absolute_path is None:
-                # File doesn't exist in any expected location, skip it
-                continue
-
-        if not absolute_path.exists():
+    base_path = storage_manager.base_path
+    candidates = [_candidate_paths(record, base_path) for record in upload_records]
+
+    # One directory listing per folder instead of several stat calls per file.
+    # Each listing is a round trip on a shared drive, so they run concurrently.
+    directories = list({path.parent for paths in candidates for path, _ in paths})
+    listings: Dict[Path, Dict[str, os.DirEntry]] = {}
+    if directories:
+        with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(directories))) as pool:
+            listings = dict(zip(directories, pool.map(_list_directory, directories), strict=True))
+
+    for record, paths in zip(upload_records, candidates, strict=True):
+        entry = None
+        for absolute_path, relative_path in paths:
+            entry = listings[absolute_path.parent].get(os.path.normcase(absolute_path.name))
+            if entry is not None and entry.is_file():
+                break
+            entry = None
+
+        if entry is None:
+            # File doesn't exist in any expected location, skip it
             continue
 
-        file_size = absolute_path.stat().st_size if absolute_path.exists() else None
+        try:
+            file_size = entry.stat().st_size
+        except OSError:
+            file_size = None
         resources.append(
             LocalResource(
                 name=record.filename,
@@ -822,6 +1202,15 @@ def _collect_resources(
     return resources
 
 
+def _prune_and_collect_resources(
+        db_manager: DatabaseManager,
+        storage_manager: LocalStorageManager,
+) -> List[LocalResource]:
+    """Drop upload records whose files are gone, then collect the remaining resources."""
+    db_manager.prune_missing_uploads(storage_manager.base_path)
+    return _collect_resources(db_manager, storage_manager)
+
+
 class ReaderApp(QMainWindow):
     """Main application window for the reader portal."""
 
@@ -836,13 +1225,34 @@ class ReaderApp(QMainWindow):
             self.storage_manager = LocalStorageManager(config=self.config, database=self.db_manager)
             self.auth_store = LocalAuthStore(self.db_manager)
             self.current_user: Optional[LocalUser] = None
+            # Display name of current_user, derived once per sign-in
+            self._display_name = ""
+            self._collect_worker: Optional[ResourceCollectWorker] = None
+            # (key, resources, collected_at) of the last scan, reused for a short while
+            self._resource_cache: Optional[
+                Tuple[Tuple[str, int, Tuple[int, int]], List[LocalResource], float]
+            ] = None
+            # (base path mtime or None when unreachable, checked_at) of the last drive stat
+            self._drive_status: Tuple[Optional[int], float] = (None, -_DRIVE_STATUS_TTL)
+            self._login_worker: Optional[LoginWorker] = None
 
             self.session_manager = SessionManager(timeout_minutes=30)
+            # Activity is recorded at most once per flush interval; later activity
+            # keeps the time it happened until the next flush
+            self._last_activity_flush = 0.0
+            self._pending_activity_at: Optional[datetime] = None
 
-            # Add session timeout checker
+            # Add session timeout checker; it fires once when the session could expire
             self.session_timer = QTimer(self)
+            self.session_timer.setSingleShot(True)
             self.session_timer.timeout.connect(self._check_session_timeout)
-            self.session_timer.start(60000)  # Check every minute
+
+            # Security events are written in batches, off the sign-in path
+            self._audit_events: List[Tuple[Optional[int], str, str, Optional[str], bool]] = []
+            self._audit_timer = QTimer(self)
+            self._audit_timer.setSingleShot(True)
+            self._audit_timer.setInterval(_AUDIT_FLUSH_MS)
+            self._audit_timer.timeout.connect(self._flush_audit_events)
 
             self.stack = QStackedWidget()
             self.setCentralWidget(self.stack)
@@ -857,7 +1267,8 @@ class ReaderApp(QMainWindow):
             self.login_page.signup_requested.connect(self.open_signup_dialog)
             self.login_page.back_to_gateway_requested.connect(self.close)
             self.dashboard.logout_requested.connect(self.handle_logout)
-            self.dashboard.refresh_requested.connect(self.refresh_resources)
+            # An explicit refresh always rescans the shared drive
+            self.dashboard.refresh_requested.connect(lambda: self.refresh_resources(force=True))
             self.dashboard.download_button.clicked.connect(self.dashboard.download_current)
             # Don't connect open_tool_in_tab here - it will be connected by parent TabbedDesktopApp
         except Exception as e:
@@ -867,12 +1278,48 @@ class ReaderApp(QMainWindow):
             raise
 
     def show_login(self) -> None:
+        self.session_timer.stop()
+        QApplication.instance().removeEventFilter(self)
         self.login_page.reset_fields()
         self.stack.setCurrentWidget(self.login_page)
         self.dashboard.clear()
 
     def show_dashboard(self) -> None:
         self.stack.setCurrentWidget(self.dashboard)
+        # User input anywhere in the application counts as session activity
+        QApplication.instance().installEventFilter(self)
+        self._schedule_session_check()
+
+    def closeEvent(self, event) -> None:
+        self.dashboard.stop_previews()
+        self._audit_timer.stop()
+        self._flush_audit_events()
+        super().closeEvent(event)
+
+    def eventFilter(self, watched, event) -> bool:
+        if event.type() in _ACTIVITY_EVENTS and self.current_user:
+            if time.monotonic() - self._last_activity_flush >= _ACTIVITY_FLUSH_INTERVAL:
+                self._flush_activity()
+            else:
+                self._pending_activity_at = datetime.now()
+        return super().eventFilter(watched, event)
+
+    def _flush_activity(self, at: Optional[datetime] = None) -> None:
+        """Record user activity that happened ``at`` (default now) on the session."""
+        self._pending_activity_at = None
+        self._last_activity_flush = time.monotonic()
+        if self.current_user:
+            self.session_manager.update_activity(self.current_user.id, at)
+
+    def _schedule_session_check(self) -> None:
+        """Sleep until the session would expire if there were no further activity."""
+        if not self.current_user:
+            return
+        remaining = self.session_manager.get_remaining_seconds(self.current_user.id)
+        if remaining is None:
+            return
+        # Wake just after the expiry so the session is seen as timed out
+        self.session_timer.start(int(remaining * 1000) + 1000)
 
     def handle_login(self, email: str, password: str, security_code: str) -> None:
         try:
@@ -889,8 +1336,31 @@ class ReaderApp(QMainWindow):
                 self.login_page.show_error(f"Configuration error: {exc}")
                 return
 
+            if self._login_worker is not None and self._login_worker.isRunning():
+                return
+
+            # The lockout check and password verification hit the database,
+            # so they run off the GUI thread
+            self.login_page.login_button.setEnabled(False)
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            self._login_worker = LoginWorker(email, password, self.auth_store, self.db_manager)
+            self._login_worker.authenticated.connect(
+                lambda user, failed_count: self._complete_login(email, user, failed_count)
+            )
+            self._login_worker.error.connect(self._on_login_error)
+            self._login_worker.start()
+        except Exception as e:
+            self._on_login_error(str(e))
+
+    def _complete_login(
+            self,
+            email: str,
+            user: Optional[LocalUser],
+            failed_count: int,
+    ) -> None:
+        self._end_login_wait()
+        try:
             # CHECK FOR ACCOUNT LOCKOUT FIRST
-            failed_count = self.db_manager.get_failed_login_count(email, minutes=15)
             if failed_count >= 5:
                 self.login_page.show_error(
                     "Account temporarily locked due to multiple failed login attempts. "
@@ -898,19 +1368,12 @@ class ReaderApp(QMainWindow):
                 )
                 return
 
-            user = self.auth_store.authenticate(email, password)
             if not user:
                 # Log failed login
-                try:
-                    self.db_manager.log_security_event(
-                        user_id=None,
-                        event_type="LOGIN_FAILED",
-                        description=f"Failed login attempt for email: {email}",
-                        success=False,
-                    )
-                except Exception as e:
-                    print(f"Warning: Failed to log security event: {e}")
-                
+                self._log_security_event(
+                    None, "LOGIN_FAILED", f"Failed login attempt for email: {email}", False
+                )
+
                 remaining_attempts = 5 - failed_count - 1
                 if remaining_attempts > 0:
                     self.login_page.show_error(
@@ -923,36 +1386,53 @@ class ReaderApp(QMainWindow):
                 return
 
             # Log successful login
-            try:
-                self.db_manager.log_security_event(
-                    user_id=user.id,
-                    event_type="LOGIN_SUCCESS",
-                    description=f"Successful login for user: {email}",
-                    success=True,
-                )
-            except Exception as e:
-                print(f"Warning: Failed to log security event: {e}")
-
-            self.session_manager.create_session(user.id)
-            self.current_user = user
+            self._log_security_event(
+                user.id, "LOGIN_SUCCESS", f"Successful login for user: {email}", True
+            )
 
             role = user.metadata.get("role")
             if role and role != "reader":
                 self.login_page.show_error("This account does not have reader access.")
                 return
 
+            self.session_manager.create_session(user.id)
             self.login_page.show_error("")
             self.current_user = user
-            display_name = user.metadata.get("display_name") or user.display_name()
-            self.dashboard.set_user_identity(display_name, user.email)
+            self._display_name = user.metadata.get("display_name") or user.display_name()
+            self.dashboard.set_user_identity(self._display_name, user.email)
             self.show_dashboard()
+            self.refresh_resources()
         except Exception as e:
             # Catch any unexpected errors to prevent app crash
             error_msg = f"Login error: {str(e)}"
             print(error_msg)
             self.login_page.show_error("An unexpected error occurred. Please try again.")
 
-        self.refresh_resources()
+    def _log_security_event(
+            self, user_id: Optional[int], event_type: str, description: str, success: bool
+    ) -> None:
+        self._audit_events.append((user_id, event_type, description, None, success))
+        if not self._audit_timer.isActive():
+            self._audit_timer.start()
+
+    @pyqtSlot()
+    def _flush_audit_events(self) -> None:
+        events, self._audit_events = self._audit_events, []
+        try:
+            self.db_manager.log_security_events_bulk(events)
+        except Exception as e:
+            print(f"Warning: Failed to log security events: {e}")
+
+    def _on_login_error(self, message: str) -> None:
+        self._end_login_wait()
+        # Catch any unexpected errors to prevent app crash
+        print(f"Login error: {message}")
+        self.login_page.show_error("An unexpected error occurred. Please try again.")
+
+    def _end_login_wait(self) -> None:
+        if QApplication.overrideCursor() is not None:
+            QApplication.restoreOverrideCursor()
+        self.login_page.login_button.setEnabled(True)
 
     def open_signup_dialog(self) -> None:
         dialog = ReaderSignupDialog(self)
@@ -974,90 +1454,125 @@ class ReaderApp(QMainWindow):
                 metadata=metadata,
             )
         except ValueError as exc:
-            QMessageBox.warning(self, "Reader Signup", str(exc))
+            self.login_page.show_error(str(exc))
             return
 
-        QMessageBox.information(
-            self,
-            "Reader Signup",
-            "Account created successfully. You can now sign in.",
-        )
         self.show_login()
         self.login_page.email_input.setText(result["email"])
+        self._notify("Account created successfully. You can now sign in.")
 
     def handle_logout(self) -> None:
         if self.current_user:
             self.session_manager.invalidate_session(self.current_user.id)
         self.current_user = None
+        self._display_name = ""
         self.show_login()
 
-    def refresh_resources(self) -> None:
+    def refresh_resources(self, force: bool = False) -> None:
         if not self.current_user:
             self.login_page.show_error("Please sign in to view files.")
             self.show_login()
             return
 
-        base_path = self.storage_manager.base_path
-        print(f"\n=== REFRESH RESOURCES DEBUG ===")
-        print(f"Base path: {base_path}")
-        print(f"Base path exists: {base_path.exists()}")
-
-        if base_path.exists():
-            print(f"Base path contents:")
-            for item in base_path.iterdir():
-                print(f"  - {item.name} ({'dir' if item.is_dir() else 'file'})")
-
-        if not base_path.exists():
-            QMessageBox.critical(
-                self,
-                "Shared Drive Error",
-                "The shared drive is not accessible. Please check your connection.",
-            )
+        # Requests made while a refresh is running are served by that refresh
+        if self._collect_worker is not None and self._collect_worker.isRunning():
             return
 
-        self.db_manager.prune_missing_uploads(base_path)
+        base_path = self.storage_manager.base_path
+        mtime = self._drive_mtime()
+        if mtime is None:
+            self._notify("The shared drive is not accessible. Please check your connection.")
+            return
 
+        # Uploads land in existing folders, so the database state is part of the key
         try:
-            resources = _collect_resources(self.db_manager, self.storage_manager)
+            cache_key = (str(base_path), mtime, self.db_manager.get_uploads_signature())
         except Exception as exc:
-            import traceback
-            traceback.print_exc()
-            QMessageBox.critical(
-                self,
-                "Shared Drive Error",
-                f"Unable to load local resources: {exc}",
-            )
+            self._on_collect_failed(str(exc))
             return
+        if not force and self._resource_cache is not None:
+            cached_key, resources, collected_at = self._resource_cache
+            if cached_key == cache_key and time.monotonic() - collected_at < _RESOURCE_CACHE_TTL:
+                self._on_resources_collected(resources)
+                return
 
-        display_name = (
-                self.current_user.metadata.get("display_name") or self.current_user.display_name()
+        # Pruning and file checks can be slow on network drives, so run them off the GUI thread
+        self._collect_worker = ResourceCollectWorker(
+            lambda: _prune_and_collect_resources(self.db_manager, self.storage_manager)
+        )
+        self._collect_worker.collected.connect(
+            lambda resources: self._cache_resources(cache_key, resources)
         )
-        self.dashboard.set_user_identity(display_name, self.current_user.email)
+        self._collect_worker.collected.connect(self._on_resources_collected)
+        self._collect_worker.error.connect(self._on_collect_failed)
+        self._collect_worker.start()
+
+    def _drive_mtime(self) -> Optional[int]:
+        """Return the shared drive's mtime, or None if it is not reachable.
+
+        A disconnected share can block a stat for seconds, so back-to-back
+        refreshes reuse the last result for a short while.
+        """
+        mtime, checked_at = self._drive_status
+        now = time.monotonic()
+        if now - checked_at < _DRIVE_STATUS_TTL:
+            return mtime
+
+        try:
+            mtime = self.storage_manager.base_path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        self._drive_status = (mtime, now)
+        return mtime
+
+    def _cache_resources(
+            self,
+            cache_key: Tuple[str, int, Tuple[int, int]],
+            resources: List[LocalResource],
+    ) -> None:
+        self._resource_cache = (cache_key, resources, time.monotonic())
+
+    def _on_resources_collected(self, resources: List[LocalResource]) -> None:
+        if not self.current_user:
+            return
+
+        self.dashboard.set_user_identity(self._display_name, self.current_user.email)
         self.dashboard.populate(resources)
 
+    def _on_collect_failed(self, message: str) -> None:
+        self._notify(f"Unable to load local resources: {message}")
+
+    def _notify(self, message: str) -> None:
+        """Show a transient message without blocking the event loop."""
+        self.statusBar().showMessage(message, _NOTIFICATION_MS)
+
+    @pyqtSlot()
     def _check_session_timeout(self) -> None:
         """Check if current session has timed out."""
         if not self.current_user:
             return
 
+        # Stamped with when it happened, so old activity cannot renew an idle session
+        if self._pending_activity_at is not None:
+            self._flush_activity(self._pending_activity_at)
+
         user_id = self.current_user.id
         if not self.session_manager.is_session_valid(user_id):
             self._handle_session_timeout()
         else:
-            # Update activity on any interaction
-            self.session_manager.update_activity(user_id)
+            # Activity moved the expiry back; sleep until the new one
+            self._schedule_session_check()
 
     def _handle_session_timeout(self) -> None:
         """Handle session timeout - force logout."""
         if self.current_user:
             self.session_manager.invalidate_session(self.current_user.id)
 
-        QMessageBox.information(
-            self,
-            "Session Expired",
-            "Your session has expired due to inactivity. Please sign in again.",
-        )
         self.handle_logout()
+        # Shown on the login page so signing in again is not gated on a dialog
+        self.login_page.show_error(
+            "Your session has expired due to inactivity. Please sign in again."
+        )
 
 
 def main() -> None:
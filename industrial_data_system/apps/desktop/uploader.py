@@ -38,6 +38,7 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
+from industrial_data_system.apps.desktop.theme import IndustrialTheme
 from industrial_data_system.core.auth import LocalAuthStore, LocalUser, UploadHistoryStore
 from industrial_data_system.core.config import get_config
 from industrial_data_system.core.constants import MAX_PREVIEW_ROWS, SUPPORTED_EXTENSIONS
@@ -83,285 +84,6 @@ _load_environment()
 CONFIG = get_config()
 
 
-class IndustrialTheme:
-    """Industrial design system color palette and styles."""
-
-    # Color Palette
-    PRIMARY = "#1E3A8A"  # Deep Blue
-    PRIMARY_LIGHT = "#3B82F6"  # Light Blue
-    PRIMARY_DARK = "#1E40AF"  # Darker Blue
-
-    SECONDARY = "#64748B"  # Slate Gray
-    SECONDARY_LIGHT = "#94A3B8"
-
-    SUCCESS = "#10B981"  # Green
-    WARNING = "#F59E0B"  # Amber
-    ERROR = "#EF4444"  # Red
-
-    BACKGROUND = "#F8FAFC"  # Light Gray
-    SURFACE = "#FFFFFF"  # White
-    SURFACE_DARK = "#F1F5F9"
-
-    TEXT_PRIMARY = "#0F172A"  # Dark Slate
-    TEXT_SECONDARY = "#475569"  # Medium Slate
-    TEXT_HINT = "#94A3B8"  # Light Slate
-
-    BORDER = "#E2E8F0"
-    BORDER_FOCUS = "#3B82F6"
-
-    @staticmethod
-    def get_stylesheet():
-        """Return complete application stylesheet."""
-        return f"""
-            QMainWindow {{
-                background-color: #F0F0F0;
-            }}
-            
-            QWidget {{
-                font-family: 'Segoe UI', 'San Francisco', 'Helvetica Neue', Arial, sans-serif;
-                font-size: 9px;
-                color: {IndustrialTheme.TEXT_PRIMARY};
-            }}
-            
-            QLabel {{
-                color: {IndustrialTheme.TEXT_PRIMARY};
-            }}
-            
-            QLabel[heading="true"] {{
-                font-size: 13px;
-                font-weight: 600;
-                color: {IndustrialTheme.TEXT_PRIMARY};
-                padding: 4px 0px;
-            }}
-            
-            QLabel[subheading="true"] {{
-                font-size: 12px;
-                font-weight: 500;
-                color: {IndustrialTheme.TEXT_PRIMARY};
-                padding: 4px 0px;
-            }}
-            
-            QLabel[caption="true"] {{
-                font-size: 12px;
-                color: {IndustrialTheme.TEXT_SECONDARY};
-            }}
-            
-            QLineEdit {{
-                padding: 12px 16px;
-                border: 2px solid {IndustrialTheme.BORDER};
-                border-radius: 2px;
-                background-color: {IndustrialTheme.SURFACE};
-                color: {IndustrialTheme.TEXT_PRIMARY};
-                font-size: 14px;
-            }}
-            
-            
-            
-            QLineEdit:disabled {{
-                background-color: {IndustrialTheme.SURFACE_DARK};
-                color: {IndustrialTheme.TEXT_HINT};
-            }}
-            
-            QComboBox {{
-                padding: 4px 8px;
-                border: 2px solid {IndustrialTheme.BORDER};
-                border-radius: 2px;
-                background-color: {IndustrialTheme.SURFACE};
-                color: {IndustrialTheme.TEXT_PRIMARY};
-                font-size: 12px;
-                min-height: 22px;
-            }}
-            
-           
-            
-            QComboBox::drop-down {{
-                border: none;
-                width: 30px;
-            }}
-            
-            QComboBox QAbstractItemView {{
-                background-color: {IndustrialTheme.SURFACE};
-                border: 2px solid {IndustrialTheme.BORDER};
-                border-radius: 8px;
-                selection-background-color: {IndustrialTheme.PRIMARY_LIGHT};
-                padding: 4px;
-            }}
-            
-            QPushButton {{
-                padding: 6px 16px;
-                border: none;
-                border-radius: 0px;
-                font-size: 12px;
-                font-weight: 500;
-                min-height: 24px;
-            }}
-            
-            QPushButton[primary="true"] {{
-                background-color: {IndustrialTheme.PRIMARY};
-                color: white;
-                border: 1px solid {IndustrialTheme.PRIMARY_DARK}; 
-            }}
-            
-            QPushButton[primary="true"]:hover {{
-                background-color: {IndustrialTheme.PRIMARY_DARK};
-            }}
-            
-            QPushButton[primary="true"]:pressed {{
-                background-color: {IndustrialTheme.PRIMARY_DARK};
-            }}
-            
-            QPushButton[secondary="true"] {{
-                background-color: {IndustrialTheme.SURFACE};
-                color: {IndustrialTheme.TEXT_PRIMARY};
-                border: 2px solid {IndustrialTheme.BORDER};
-            }}
-            
-            QPushButton[secondary="true"]:hover {{
-                background-color: {IndustrialTheme.SURFACE_DARK};
-                border: 2px solid {IndustrialTheme.SECONDARY};
-            }}
-            
-            QPushButton[danger="true"] {{
-                background-color: {IndustrialTheme.ERROR};
-                color: white;
-            }}
-            
-            QPushButton[danger="true"]:hover {{
-                background-color: #DC2626;
-            }}
-            
-            QPushButton[flat="true"] {{
-                background-color: transparent;
-                color: {IndustrialTheme.PRIMARY};
-                padding: 8px 16px;
-            }}
-            
-            QPushButton[flat="true"]:hover {{
-                background-color: rgba(59, 130, 246, 0.1);
-            }}
-            
-            QPushButton:disabled {{
-                background-color: {IndustrialTheme.SURFACE_DARK};
-                color: {IndustrialTheme.TEXT_HINT};
-            }}
-            
-            QTableWidget {{
-                background-color: {IndustrialTheme.SURFACE};
-                border: 1px solid {IndustrialTheme.BORDER};
-                border-radius: 8px;
-                gridline-color: {IndustrialTheme.BORDER};
-            }}
-            
-            QTableWidget::item {{
-                padding: 12px;
-                border-bottom: 1px solid {IndustrialTheme.BORDER};
-            }}
-            
-            QTableWidget::item:selected {{
-                background-color: rgba(59, 130, 246, 0.1);
-                color: {IndustrialTheme.TEXT_PRIMARY};
-            }}
-            
-            QHeaderView::section {{
-                background-color: {IndustrialTheme.SURFACE_DARK};
-                padding: 12px;
-                border: none;
-                border-bottom: 2px solid {IndustrialTheme.BORDER};
-                font-weight: 600;
-                color: {IndustrialTheme.TEXT_PRIMARY};
-            }}
-            
-            QFrame[card="true"] {{
-                background-color: {IndustrialTheme.SURFACE};
-                border: 1px solid {IndustrialTheme.BORDER};
-                border-radius: 12px;
-                padding: 24px;
-            }}
-            
-            QDialog {{
-                background-color: {IndustrialTheme.SURFACE};
-            }}
-            
-            QScrollBar:vertical {{
-                border: none;
-                background-color: {IndustrialTheme.SURFACE_DARK};
-                width: 12px;
-                border-radius: 6px;
-            }}
-            
-            QScrollBar::handle:vertical {{
-                background-color: {IndustrialTheme.SECONDARY_LIGHT};
-                border-radius: 6px;
-                min-height: 30px;
-            }}
-            
-            QScrollBar::handle:vertical:hover {{
-                background-color: {IndustrialTheme.SECONDARY};
-            }}
-            
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border: 2px solid #000000;
-                border-radius: 3px;
-                background-color: {IndustrialTheme.SURFACE};
-            }}
-            
-            QCheckBox::indicator:hover {{
-                border-color: #000000;
-                background-color: {IndustrialTheme.SURFACE_DARK};
-            }}
-            
-            QCheckBox::indicator:checked {{
-                background-color: #000000;
-                border-color: #000000;
-            }}
-
-            QTabWidget::pane {{
-                border: 1px solid {IndustrialTheme.BORDER};
-                border-radius: 8px;
-                background-color: {IndustrialTheme.SURFACE};
-                padding: 8px;
-            }}
-
-            QTabWidget::tab-bar {{
-                alignment: left;
-            }}
-
-            QTabBar::tab {{
-                background-color: {IndustrialTheme.SURFACE_DARK};
-                color: {IndustrialTheme.TEXT_SECONDARY};
-                border: 1px solid {IndustrialTheme.BORDER};
-                border-bottom: none;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                padding: 12px 24px;
-                margin-right: 4px;
-                min-width: 100px;
-                font-size: 14px;
-                font-weight: 500;
-            }}
-
-            QTabBar::tab:selected {{
-                background-color: {IndustrialTheme.SURFACE};
-                color: {IndustrialTheme.PRIMARY};
-                border-bottom: 2px solid {IndustrialTheme.PRIMARY};
-            }}
-
-            QTabBar::tab:hover:!selected {{
-                background-color: {IndustrialTheme.SURFACE};
-                color: {IndustrialTheme.TEXT_PRIMARY};
-            }}
-
-            QTabBar::tab:first {{
-                margin-left: 0px;
-            }}
-        """
-
-
 class NewPumpSeriesDialog(QDialog):
     """Dialog for creating a new pump series."""
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import secrets
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -16,44 +17,61 @@ DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
 class SessionManager:
-    """Manage user sessions with timeout and expiry tracking."""
+    """Manage user sessions with timeout and expiry tracking.
+
+    All methods are safe to call from worker threads.
+    """
 
     def __init__(self, timeout_minutes: int = 30):
         self.timeout_minutes = timeout_minutes
         self._sessions: Dict[int, datetime] = {}  # user_id -> last_activity
+        self._lock = threading.RLock()
 
     def create_session(self, user_id: int) -> None:
         """Create a new session for user."""
-        self._sessions[user_id] = datetime.now()
-
-    def update_activity(self, user_id: int) -> None:
-        """Update last activity timestamp."""
-        if user_id in self._sessions:
+        with self._lock:
             self._sessions[user_id] = datetime.now()
 
+    def update_activity(self, user_id: int, at: Optional[datetime] = None) -> None:
+        """Update last activity timestamp to ``at`` (default now); it never moves back."""
+        at = at or datetime.now()
+        with self._lock:
+            last_activity = self._sessions.get(user_id)
+            if last_activity is not None and at > last_activity:
+                self._sessions[user_id] = at
+
     def is_session_valid(self, user_id: int) -> bool:
         """Check if session is still valid (not timed out)."""
-        if user_id not in self._sessions:
-            return False
-
-        last_activity = self._sessions[user_id]
-        timeout = timedelta(minutes=self.timeout_minutes)
-        return datetime.now() - last_activity < timeout
+        remaining = self._remaining(user_id)
+        return remaining is not None and remaining > timedelta(0)
 
     def invalidate_session(self, user_id: int) -> None:
         """Remove session (logout)."""
-        self._sessions.pop(user_id, None)
+        with self._lock:
+            self._sessions.pop(user_id, None)
+
+    def get_remaining_seconds(self, user_id: int) -> Optional[float]:
+        """Get seconds until the session times out without further activity."""
+        remaining = self._remaining(user_id)
+        if remaining is None:
+            return None
+        return max(0.0, remaining.total_seconds())
 
     def get_remaining_time(self, user_id: int) -> Optional[int]:
         """Get remaining session time in minutes."""
-        if user_id not in self._sessions:
+        remaining = self._remaining(user_id)
+        if remaining is None:
             return None
-
-        last_activity = self._sessions[user_id]
-        timeout = timedelta(minutes=self.timeout_minutes)
-        remaining = timeout - (datetime.now() - last_activity)
         return max(0, int(remaining.total_seconds() / 60))
 
+    def _remaining(self, user_id: int) -> Optional[timedelta]:
+        # The timestamp is read once under the lock; datetimes are immutable
+        with self._lock:
+            last_activity = self._sessions.get(user_id)
+        if last_activity is None:
+            return None
+        return timedelta(minutes=self.timeout_minutes) - (datetime.now() - last_activity)
+
 
 def validate_password_strength(password: str) -> tuple[bool, str]:
     """Validate password meets minimum security requirements.
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 from industrial_data_system.core.database import SQLiteDatabase, get_database
 
@@ -878,6 +879,11 @@ class DatabaseManager:
         query = "UPDATE uploads SET " + ", ".join(fields) + " WHERE id = ?"
         self._execute(query, params)
 
+    def get_uploads_signature(self) -> Tuple[int, int]:
+        """Return (count, highest id) of uploads; it changes when uploads are added or removed."""
+        row = self._execute("SELECT COUNT(*), COALESCE(MAX(id), 0) FROM uploads", fetchone=True)
+        return (int(row[0]), int(row[1])) if row else (0, 0)
+
     def prune_missing_uploads(self, base_path: Path) -> int:
         """Remove upload records that no longer have files on disk.
 
@@ -896,6 +902,20 @@ class DatabaseManager:
         if not base_path.exists():
             return 0
 
+        # One directory listing per folder instead of a stat call per record
+        listings: Dict[Path, Set[str]] = {}
+
+        def file_exists(path: Path) -> bool:
+            names = listings.get(path.parent)
+            if names is None:
+                try:
+                    with os.scandir(path.parent) as it:
+                        names = {os.path.normcase(entry.name) for entry in it if entry.is_file()}
+                except (FileNotFoundError, NotADirectoryError):
+                    names = set()
+                listings[path.parent] = names
+            return os.path.normcase(path.name) in names
+
         removed = 0
         for record in self.list_uploads():
             file_path = record.file_path
@@ -903,7 +923,7 @@ class DatabaseManager:
             if candidate and not candidate.is_absolute():
                 candidate = base_path / candidate
 
-            if not candidate or not candidate.exists():
+            if not candidate or not file_exists(candidate):
                 self.delete_upload(record.id)
                 removed += 1
 
@@ -968,6 +988,30 @@ class DatabaseManager:
             (user_id, event_type, description, ip_address, 1 if success else 0),
         )
 
+    def log_security_events_bulk(
+        self,
+        events: Iterable[Tuple[Optional[int], str, str, Optional[str], bool]],
+    ) -> None:
+        """Log several security events in one transaction.
+
+        Each event is ``(user_id, event_type, description, ip_address, success)``.
+        """
+        rows = [
+            (user_id, event_type, description, ip_address, 1 if success else 0)
+            for user_id, event_type, description, ip_address, success in events
+        ]
+        if not rows:
+            return
+        with self.transaction() as connection:
+            connection.executemany(
+                """
+                INSERT INTO security_audit_log
+                (user_id, event_type, description, ip_address, success)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+
 
 __all__ = [
     "DatabaseManager",
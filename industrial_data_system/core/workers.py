@@ -1,7 +1,8 @@
 """Background workers for long-running tasks"""
 
+import shutil
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, List
 
 from PyQt5.QtCore import QThread, pyqtSignal
 
@@ -63,3 +64,114 @@ class FileUploadWorker(QThread):
         # Final progress
         self.progress.emit(100, "Complete")
         self.finished.emit(successful, failed)
+
+
+class DataFrameLoadWorker(QThread):
+    """Load a data file in background thread"""
+
+    loaded = pyqtSignal(object)  # loaded data, typically a pandas DataFrame
+    error = pyqtSignal(str)
+
+    def __init__(self, file_path: Path, loader: Callable[[Path], Any]):
+        super().__init__()
+        self.file_path = file_path
+        self.loader = loader
+
+    def run(self):
+        try:
+            data = self.loader(self.file_path)
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+
+        self.loaded.emit(data)
+
+
+class ReportExportWorker(QThread):
+    """Write a report file in background thread"""
+
+    exported = pyqtSignal(bool)  # whether the report was written
+    error = pyqtSignal(str)
+
+    def __init__(self, file_path: str, exporter: Callable[[str], bool]):
+        super().__init__()
+        self.file_path = file_path
+        self.exporter = exporter
+
+    def run(self):
+        try:
+            success = self.exporter(self.file_path)
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+
+        self.exported.emit(bool(success))
+
+
+class ResourceCollectWorker(QThread):
+    """Collect file listings in background thread"""
+
+    collected = pyqtSignal(list)  # collected resources
+    error = pyqtSignal(str)
+
+    def __init__(self, collector: Callable[[], List[Any]]):
+        super().__init__()
+        self.collector = collector
+
+    def run(self):
+        try:
+            resources = self.collector()
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+
+        self.collected.emit(list(resources))
+
+
+class FileCopyWorker(QThread):
+    """Copy a file in background thread"""
+
+    copied = pyqtSignal(str)  # destination path
+    error = pyqtSignal(str)
+
+    def __init__(self, source: Path, destination: Path):
+        super().__init__()
+        self.source = source
+        self.destination = destination
+
+    def run(self):
+        try:
+            # copy2 uses the platform's kernel-side copy where one exists
+            shutil.copy2(self.source, self.destination)
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+
+        self.copied.emit(str(self.destination))
+
+
+class LoginWorker(QThread):
+    """Check login credentials in background thread"""
+
+    authenticated = pyqtSignal(object, int)  # user or None, recent failed attempts
+    error = pyqtSignal(str)
+
+    def __init__(self, email: str, password: str, auth_store, db_manager):
+        super().__init__()
+        self.email = email
+        self.password = password
+        self.auth_store = auth_store
+        self.db_manager = db_manager
+
+    def run(self):
+        try:
+            failed_count = self.db_manager.get_failed_login_count(self.email, minutes=15)
+            user = None
+            # Locked accounts are not checked against the store at all
+            if failed_count < 5:
+                user = self.auth_store.authenticate(self.email, self.password)
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+
+        self.authenticated.emit(user, failed_count)
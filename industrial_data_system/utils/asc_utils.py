@@ -95,8 +95,20 @@ def load_and_process_asc_file(file_name):
 
 
 def load_and_process_csv_file(file_name):
-    """Load CSV file with consistent handling."""
-    df = pd.read_csv(file_name)
+    """Load CSV file with consistent handling.
+
+    Parses with pandas' multithreaded pyarrow engine when available. Falls back
+    to the default parser if pyarrow is missing, rejects the file, or infers
+    timestamp columns that the default parser would keep as text.
+    """
+    try:
+        df = pd.read_csv(file_name, engine="pyarrow")
+    except (ImportError, ValueError) as e:
+        logger.debug(f"pyarrow CSV parser failed for {file_name}: {e}")
+        df = None
+
+    if df is None or any(pd.api.types.is_datetime64_any_dtype(dtype) for dtype in df.dtypes):
+        df = pd.read_csv(file_name)
     # Fill NaN to maintain consistency
     df = df.fillna(0.0)
     return df
@@ -0,0 +1,101 @@
+"""Session timeout handling of the reader application."""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime, timedelta
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt5.QtCore import QEvent, Qt
+from PyQt5.QtGui import QKeyEvent
+from PyQt5.QtWidgets import QApplication
+
+from industrial_data_system.apps.desktop import reader
+from industrial_data_system.core import auth, config
+
+START = datetime(2024, 1, 1, 8, 0, 0)
+
+
+class _Clock:
+    """Controllable replacement for ``datetime.now``."""
+
+    current = START
+
+
+class _FakeDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return _Clock.current
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    _Clock.current = START
+    monkeypatch.setattr(auth, "datetime", _FakeDatetime)
+    monkeypatch.setattr(reader, "datetime", _FakeDatetime)
+    return _Clock
+
+
+@pytest.fixture
+def reader_app(tmp_path, monkeypatch, clock):
+    # Keep the database and file store out of the configured shared drive
+    monkeypatch.setenv("SHARED_DRIVE_PATH", str(tmp_path))
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "database" / "industrial_data.db"))
+    monkeypatch.setenv("FILES_BASE_PATH", str(tmp_path / "files"))
+    monkeypatch.setattr(config, "_CONFIG_SINGLETON", None)
+    app = QApplication.instance() or QApplication([])
+    window = reader.ReaderApp()
+    window.current_user = auth.LocalUser(
+        id=1,
+        email="reader@example.com",
+        username=None,
+        password_hash="",
+        salt="",
+        metadata={"role": "reader"},
+        created_at="",
+    )
+    window.session_manager.create_session(1)
+    # The sign-in itself counts as the latest flush, so new activity is only queued
+    window._flush_activity()
+    yield window
+    window.session_timer.stop()
+    window.close()
+    app.processEvents()
+
+
+def _key_press(window: reader.ReaderApp) -> None:
+    window.eventFilter(window, QKeyEvent(QEvent.KeyPress, Qt.Key_A, Qt.NoModifier))
+
+
+def test_queued_activity_before_timeout_does_not_renew_session(reader_app, clock):
+    clock.current = START + timedelta(seconds=2)
+    _key_press(reader_app)
+    assert reader_app._pending_activity_at is not None
+
+    clock.current = START + timedelta(minutes=31)
+    reader_app._check_session_timeout()
+
+    assert reader_app.current_user is None
+    assert not reader_app.session_manager.is_session_valid(1)
+
+
+def test_queued_activity_moves_expiry_to_its_own_time(reader_app, clock):
+    clock.current = START + timedelta(minutes=10)
+    _key_press(reader_app)
+
+    clock.current = START + timedelta(minutes=31)
+    reader_app._check_session_timeout()
+
+    assert reader_app.current_user is not None
+    assert reader_app.session_manager.get_remaining_seconds(1) == pytest.approx(9 * 60)
+
+
+def test_update_activity_never_moves_back(clock):
+    manager = auth.SessionManager(timeout_minutes=30)
+    manager.create_session(1)
+
+    manager.update_activity(1, START - timedelta(minutes=5))
+
+    assert manager.get_remaining_seconds(1) == pytest.approx(30 * 60)